@@ -0,0 +1,17 @@
+"""
+Student Performance Analysis
+Importable, lazily evaluated statistics for StudentsPerformance.csv, with optional plotting
+"""
+
+__all__ = ['StudentPerformanceAnalysis', 'ScoreAggregates']
+
+
+def __getattr__(name):
+    # Defer pandas/numpy until a class is first used, so importing the package is instant
+    if name == 'StudentPerformanceAnalysis':
+        from .analysis import StudentPerformanceAnalysis
+        return StudentPerformanceAnalysis
+    if name == 'ScoreAggregates':
+        from .aggregates import ScoreAggregates
+        return ScoreAggregates
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
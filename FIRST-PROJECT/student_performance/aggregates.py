@@ -0,0 +1,137 @@
+"""
+Score Aggregates
+Every (dimension x score) count/mean/std for the student report from one pass over the rows
+"""
+
+import numpy as np
+import pandas as pd
+
+# Grouping columns and score columns after the column-name clean-up
+DIMENSIONS = ['gender', 'race_ethnicity', 'parental_level_of_education',
+              'lunch', 'test_preparation_course']
+SCORES = ['math_score', 'reading_score', 'writing_score', 'average_score']
+
+
+class ScoreAggregates:
+    """Counts, sums and sums of squares over the joint grid of all dimensions
+
+    Each row's category codes are combined into one cell index, and
+    np.bincount accumulates every score for all cells at once. Any grouping
+    (one dimension, or a pivot of two) is then a sum over the small cell grid
+    instead of another groupby over the rows. Missing scores are skipped as
+    groupby().mean() skips them: ``present`` counts the non-missing values of
+    each score per cell, and means and standard deviations divide by it.
+    """
+
+    def __init__(self, levels, scores, count, present, sums, sumsq):
+        self.levels = levels
+        self.dimensions = list(levels)
+        self.scores = list(scores)
+        self.count = count
+        self.present = present
+        self.sums = sums
+        self.sumsq = sumsq
+
+    @classmethod
+    def from_frame(cls, df, dimensions=DIMENSIONS, scores=SCORES):
+        levels = {}
+        cell = np.zeros(len(df), dtype=np.int64)
+        # Rows with a missing category are skipped, as groupby drops NaN keys
+        valid = np.ones(len(df), dtype=bool)
+        for dim in dimensions:
+            codes, uniques = pd.factorize(df[dim], sort=True)
+            levels[dim] = list(uniques)
+            valid &= codes >= 0
+            cell = cell * len(uniques) + codes
+        shape = tuple(len(levels[dim]) for dim in dimensions)
+        n_cells = int(np.prod(shape))
+
+        cell = cell[valid]
+        values = df[scores].to_numpy(dtype=np.float64)[valid]
+        observed = ~np.isnan(values)
+        values = np.where(observed, values, 0.0)
+
+        def per_cell(weights):
+            return np.stack([np.bincount(cell, weights=weights[:, j], minlength=n_cells)
+                             for j in range(len(scores))], axis=-1).reshape(shape + (len(scores),))
+
+        count = np.bincount(cell, minlength=n_cells).reshape(shape)
+        present = per_cell(observed).astype(np.int64)
+        return cls(levels, scores, count, present, per_cell(values), per_cell(values ** 2))
+
+    def merge(self, other):
+        """Combine with the aggregates of another chunk of rows
+
+        Category levels are unioned (a chunk may not contain every group), so
+        merging chunk results gives the same grid as one pass over all rows.
+        """
+        if other.dimensions != self.dimensions or other.scores != self.scores:
+            raise ValueError("Can only merge aggregates over the same dimensions and scores")
+        levels = {dim: sorted(set(self.levels[dim]) | set(other.levels[dim]))
+                  for dim in self.dimensions}
+        shape = tuple(len(levels[dim]) for dim in self.dimensions)
+        count = np.zeros(shape, dtype=np.int64)
+        present = np.zeros(shape + (len(self.scores),), dtype=np.int64)
+        sums = np.zeros(shape + (len(self.scores),))
+        sumsq = np.zeros(shape + (len(self.scores),))
+        for part in (self, other):
+            # Positions of this part's levels in the merged grid (unique, so += is safe)
+            index = np.ix_(*[[levels[dim].index(level) for level in part.levels[dim]]
+                             for dim in self.dimensions])
+            count[index] += part.count
+            present[index] += part.present
+            sums[index] += part.sums
+            sumsq[index] += part.sumsq
+        return ScoreAggregates(levels, self.scores, count, present, sums, sumsq)
+
+    def _marginal(self, dims):
+        """Row count, present counts, sums and sums of squares over every dimension not in ``dims``"""
+        other = tuple(i for i, dim in enumerate(self.dimensions) if dim not in dims)
+        # Put the kept axes in the requested order
+        kept = [dim for dim in self.dimensions if dim in dims]
+        order = [kept.index(dim) for dim in dims]
+        per_score = order + [len(order)]
+        return (self.count.sum(axis=other).transpose(order),
+                self.present.sum(axis=other).transpose(per_score),
+                self.sums.sum(axis=other).transpose(per_score),
+                self.sumsq.sum(axis=other).transpose(per_score))
+
+    def _index(self, dims):
+        if len(dims) == 1:
+            return pd.Index(self.levels[dims[0]], name=dims[0])
+        return pd.MultiIndex.from_product([self.levels[dim] for dim in dims], names=dims)
+
+    def counts(self, *dims):
+        """Rows per group"""
+        count = self._marginal(dims)[0]
+        return pd.Series(count.ravel(), index=self._index(dims), name='count')
+
+    def mean_table(self, *dims):
+        """Mean of every score per group, like df.groupby(list(dims))[SCORES].mean()"""
+        count, present, sums, _ = self._marginal(dims)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / present
+        table = pd.DataFrame(means.reshape(-1, len(self.scores)),
+                             index=self._index(dims), columns=self.scores)
+        # Combinations with no students are left out, as groupby does
+        return table[count.ravel() > 0]
+
+    def std_table(self, *dims):
+        """Sample standard deviation (ddof=1) of every score per group"""
+        count, present, sums, sumsq = self._marginal(dims)
+        n = present.astype(np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            var = (sumsq - sums ** 2 / n) / (n - 1)
+        table = pd.DataFrame(np.sqrt(np.maximum(var, 0)).reshape(-1, len(self.scores)),
+                             index=self._index(dims), columns=self.scores)
+        return table[count.ravel() > 0]
+
+    def overall(self):
+        """Non-missing count, mean and sample std of every score over all rows"""
+        n = self.present.reshape(-1, len(self.scores)).sum(axis=0)
+        sums = self.sums.reshape(-1, len(self.scores)).sum(axis=0)
+        sumsq = self.sumsq.reshape(-1, len(self.scores)).sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            var = np.where(n > 1, (sumsq - sums ** 2 / n) / (n - 1), np.nan)
+        return pd.DataFrame({'count': n, 'mean': sums / n, 'std': np.sqrt(np.maximum(var, 0))},
+                            index=self.scores)
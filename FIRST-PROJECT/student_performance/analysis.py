@@ -0,0 +1,236 @@
+"""
+Analysis
+StudentPerformanceAnalysis: statistics computed on first access and memoized
+"""
+
+from functools import cached_property
+import pandas as pd
+
+from .aggregates import ScoreAggregates
+
+SUBJECTS = ['math_score', 'reading_score', 'writing_score']
+NUMERIC_COLUMNS = SUBJECTS + ['total_score']
+
+# Factors compared in the "impact" chart, with their display labels
+FACTORS = {'gender': 'Gender', 'lunch': 'Lunch Type', 'test_preparation_course': 'Test Prep'}
+
+
+def clean_column_name(name):
+    """'race/ethnicity' -> 'race_ethnicity', 'math score' -> 'math_score'"""
+    return name.replace('/', '_').replace(' ', '_')
+
+
+class StudentPerformanceAnalysis:
+    """Student performance statistics for one CSV file (or an existing DataFrame)
+
+    Nothing is read or computed in the constructor. Each property is built
+    the first time it is accessed and then cached, so services can ask for
+    one table without paying for the rest. Charts live in the optional
+    ``student_performance.plotting`` module, which is the only place
+    matplotlib and seaborn are imported.
+    """
+
+    # Whether rows are kept (False) or only accumulators (see streaming.py)
+    streaming = False
+
+    def __init__(self, source='StudentsPerformance.csv', compact=False, cache_dir=None):
+        self.source = source
+        # compact: category/uint8 columns via loader.load_students, cached when cache_dir is set
+        self.compact = compact
+        self.cache_dir = cache_dir
+
+    @cached_property
+    def data(self):
+        """Cleaned frame with total_score and average_score added"""
+        if self.compact and not isinstance(self.source, pd.DataFrame):
+            from .loader import load_students
+            df, self.source_columns = load_students(self.source, self.cache_dir)
+            return df
+        if isinstance(self.source, pd.DataFrame):
+            df = self.source.copy()
+        else:
+            df = pd.read_csv(self.source)
+        self.source_columns = df.columns.tolist()
+        df.columns = [clean_column_name(col) for col in df.columns]
+        df['total_score'] = df['math_score'] + df['reading_score'] + df['writing_score']
+        df['average_score'] = df['total_score'] / 3
+        return df
+
+    @property
+    def source_data(self):
+        """The input columns under their original names (a renamed view of ``data``)"""
+        df = self.data[[clean_column_name(col) for col in self.source_columns]]
+        return df.set_axis(self.source_columns, axis=1)
+
+    @cached_property
+    def aggregates(self):
+        """Every grouped count/mean/std, from one pass over the rows"""
+        return ScoreAggregates.from_frame(self.data)
+
+    @cached_property
+    def overall(self):
+        """Count, mean and std of each score over all students"""
+        return self.aggregates.overall()
+
+    @cached_property
+    def subject_averages(self):
+        return self.overall.loc[SUBJECTS, 'mean']
+
+    @cached_property
+    def correlation_matrix(self):
+        return self.data[NUMERIC_COLUMNS].corr()
+
+    @cached_property
+    def gender_scores(self):
+        return self.aggregates.mean_table('gender')[SUBJECTS]
+
+    @cached_property
+    def lunch_scores(self):
+        return self.aggregates.mean_table('lunch')[SUBJECTS]
+
+    @cached_property
+    def education_scores(self):
+        """Average score per parental education level, best first"""
+        return (self.aggregates.mean_table('parental_level_of_education')['average_score']
+                .sort_values(ascending=False))
+
+    @cached_property
+    def race_scores(self):
+        """Average score per race/ethnicity group, best first"""
+        return self.aggregates.mean_table('race_ethnicity')['average_score'].sort_values(ascending=False)
+
+    @cached_property
+    def gender_race_pivot(self):
+        return self.aggregates.mean_table('gender', 'race_ethnicity')['average_score'].unstack()
+
+    @cached_property
+    def factor_effects(self):
+        """Spread (max - min) of group average scores for each factor"""
+        effects = {}
+        for factor in FACTORS:
+            factor_scores = self.aggregates.mean_table(factor)['average_score']
+            effects[factor] = factor_scores.max() - factor_scores.min()
+        return pd.Series(effects)
+
+    def performance_by(self, dimension):
+        """Mean of every score, plus average_score, per group of a dimension"""
+        return self.aggregates.mean_table(dimension)
+
+    @property
+    def n_students(self):
+        return len(self.data)
+
+    @property
+    def total_score_range(self):
+        """(lowest, highest) total score"""
+        return self.data['total_score'].min(), self.data['total_score'].max()
+
+    def dataset_info(self):
+        """Shape, first rows, dtypes, missing counts and describe() of the input columns"""
+        source = self.source_data
+        return {
+            'shape': source.shape,
+            'columns': source.columns.tolist(),
+            'head': source.head(),
+            'dtypes': source.dtypes,
+            'missing': source.isnull().sum(),
+            'describe': source.describe()
+        }
+
+    def print_overview(self):
+        """Dataset information and subject averages"""
+        info = self.dataset_info()
+        print("\n=== BASIC DATASET INFORMATION ===")
+        print(f"Dataset shape: {info['shape']}")
+        print(f"Number of students: {info['shape'][0]}")
+        print(f"Number of columns: {info['shape'][1]}")
+
+        print("\n=== COLUMN NAMES ===")
+        print(info['columns'])
+
+        print("\n=== FIRST 5 ROWS ===")
+        print(info['head'])
+
+        print("\n=== DATA TYPES ===")
+        print(info['dtypes'])
+
+        print("\n=== MISSING VALUES ===")
+        print(info['missing'])
+
+        print("\n=== BASIC STATISTICS ===")
+        print(info['describe'])
+
+        math_avg, reading_avg, writing_avg = self.subject_averages
+        print("\n=== AVERAGE SCORES BY SUBJECT ===")
+        print(f"Average Math Score: {math_avg:.2f}")
+        print(f"Average Reading Score: {reading_avg:.2f}")
+        print(f"Average Writing Score: {writing_avg:.2f}")
+        print(f"Overall Average Score: {self.overall.loc['average_score', 'mean']:.2f}")
+
+    def print_insights(self):
+        """Group performance tables and key insights"""
+        test_prep_analysis = self.performance_by('test_preparation_course')
+        lunch_analysis = self.performance_by('lunch')
+
+        print("\n=== PERFORMANCE BY TEST PREPARATION ===")
+        print(test_prep_analysis)
+
+        print("\n=== PERFORMANCE BY LUNCH TYPE ===")
+        print(lunch_analysis)
+
+        print("\n=== PERFORMANCE BY RACE/ETHNICITY ===")
+        print(self.performance_by('race_ethnicity'))
+
+        math_avg, reading_avg, writing_avg = self.subject_averages
+        corr = self.correlation_matrix
+        print("\n=== KEY INSIGHTS AND OBSERVATIONS ===")
+        print("\n1. SUBJECT PERFORMANCE:")
+        print(f"   - Reading has the highest average score ({reading_avg:.2f})")
+        print(f"   - Writing is second ({writing_avg:.2f})")
+        print(f"   - Math has the lowest average score ({math_avg:.2f})")
+
+        print(f"\n2. SCORE CORRELATIONS:")
+        print(f"   - Math and Reading correlation: {corr.loc['math_score', 'reading_score']:.3f}")
+        print(f"   - Reading and Writing correlation: {corr.loc['reading_score', 'writing_score']:.3f}")
+        print(f"   - Math and Writing correlation: {corr.loc['math_score', 'writing_score']:.3f}")
+
+        print(f"\n3. GENDER DIFFERENCES:")
+        gender_diff = self.gender_scores
+        for subject, label in (('math_score', 'Math'), ('reading_score', 'Reading'),
+                               ('writing_score', 'Writing')):
+            better = ('Females' if gender_diff.loc['female', subject] > gender_diff.loc['male', subject]
+                      else 'Males')
+            print(f"   - {label}: {better} perform better")
+
+        print(f"\n4. TEST PREPARATION IMPACT:")
+        prep_impact = test_prep_analysis['average_score']
+        if len(prep_impact) > 1:
+            print(f"   - Students with test preparation: {prep_impact.get('completed', 0):.2f}")
+            print(f"   - Students without test preparation: {prep_impact.get('none', 0):.2f}")
+            print(f"   - Improvement: {prep_impact.get('completed', 0) - prep_impact.get('none', 0):.2f} points")
+
+        print(f"\n5. SOCIOECONOMIC FACTORS:")
+        lunch_impact = lunch_analysis['average_score']
+        if len(lunch_impact) > 1:
+            print(f"   - Standard lunch students: {lunch_impact.get('standard', 0):.2f}")
+            print(f"   - Free/reduced lunch students: {lunch_impact.get('free/reduced', 0):.2f}")
+            print(f"   - Gap: {lunch_impact.get('standard', 0) - lunch_impact.get('free/reduced', 0):.2f} points")
+
+        education_scores = self.education_scores
+        print(f"\n6. PARENTAL EDUCATION IMPACT:")
+        print(f"   - Highest performing group: {education_scores.index[0]} ({education_scores.iloc[0]:.2f})")
+        print(f"   - Lowest performing group: {education_scores.index[-1]} ({education_scores.iloc[-1]:.2f})")
+        print(f"   - Education gap: {education_scores.iloc[0] - education_scores.iloc[-1]:.2f} points")
+
+        print(f"\n7. OVERALL STATISTICS:")
+        lowest, highest = self.total_score_range
+        print(f"   - Total students analyzed: {self.n_students}")
+        print(f"   - Overall average score: {self.overall.loc['average_score', 'mean']:.2f}")
+        print(f"   - Standard deviation: {self.overall.loc['average_score', 'std']:.2f}")
+        print(f"   - Highest total score: {highest}")
+        print(f"   - Lowest total score: {lowest}")
+
+    def show_figures(self):
+        """Display the three 2x2 figure sets (imports the plotting backend)"""
+        from . import plotting
+        plotting.show_all(self)
@@ -0,0 +1,151 @@
+"""
+Loader
+Compact student records (category dtypes, uint8 scores) with a binary cache keyed by file hash
+"""
+
+import hashlib
+import os
+import time
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+from .analysis import clean_column_name
+
+DEFAULT_CACHE_DIR = '.student_cache'
+
+CATEGORY_COLUMNS = ['gender', 'race/ethnicity', 'parental level of education',
+                    'lunch', 'test preparation course']
+SCORE_COLUMNS = ['math score', 'reading score', 'writing score']
+
+# Scores are 0-100, so uint8 holds them; the total (0-300) needs uint16
+CSV_DTYPES = {col: 'category' for col in CATEGORY_COLUMNS}
+CSV_DTYPES.update({col: 'uint8' for col in SCORE_COLUMNS})
+
+
+def prepare(df):
+    """Clean column names and add the derived scores to a compact frame
+
+    Returns (cleaned frame, original column names). total_score is uint16;
+    average_score stays float64 so every printed statistic is unchanged.
+    """
+    source_columns = df.columns.tolist()
+    df = df.set_axis([clean_column_name(col) for col in source_columns], axis=1)
+    df['total_score'] = df['math_score'].astype(np.uint16) + df['reading_score'] + df['writing_score']
+    df['average_score'] = df['total_score'] / 3
+    return df, source_columns
+
+
+def _cache_name(filepath):
+    """Cache file stem: a hash of the CSV bytes, so an edited file is re-parsed"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return 'students_' + digest.hexdigest()[:24]
+
+
+def _read_cached(stem):
+    """The parsed CSV from a cache file, or None if there is none"""
+    if feather is not None and os.path.exists(stem + '.feather'):
+        return feather.read_feather(stem + '.feather')
+    if os.path.exists(stem + '.npz'):
+        with np.load(stem + '.npz') as arrays:
+            columns = {}
+            for i, col in enumerate(arrays['columns']):
+                if f'codes{i}' in arrays:
+                    columns[col] = pd.Categorical.from_codes(arrays[f'codes{i}'], arrays[f'labels{i}'])
+                else:
+                    columns[col] = arrays[f'values{i}']
+        return pd.DataFrame(columns)
+    return None
+
+
+def _write_cached(stem, df):
+    """Store the parsed CSV as Feather, or as category codes/labels and arrays in an .npz"""
+    suffix = '.feather' if feather is not None else '.npz'
+    # Written under a temporary name and renamed, so readers never see half a file
+    temp = f'{stem}.{os.getpid()}.tmp'
+    if feather is not None:
+        feather.write_feather(df, temp, compression='uncompressed')
+    else:
+        arrays = {'columns': np.array(df.columns, dtype=str)}
+        for i, col in enumerate(df.columns):
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                arrays[f'codes{i}'] = df[col].cat.codes.to_numpy()
+                arrays[f'labels{i}'] = df[col].cat.categories.to_numpy(dtype=str)
+            else:
+                arrays[f'values{i}'] = df[col].to_numpy()
+        with open(temp, 'wb') as f:
+            np.savez(f, **arrays)
+    os.replace(temp, stem + suffix)
+
+
+def load_students(filepath='StudentsPerformance.csv', cache_dir=DEFAULT_CACHE_DIR):
+    """Compact cleaned frame and original column names, from the cache when the file is unchanged"""
+    if cache_dir is None:
+        return prepare(pd.read_csv(filepath, dtype=CSV_DTYPES))
+    stem = os.path.join(cache_dir, _cache_name(filepath))
+    df = _read_cached(stem)
+    if df is None:
+        df = pd.read_csv(filepath, dtype=CSV_DTYPES)
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_cached(stem, df)
+    return prepare(df)
+
+
+def compare_loaders(filepath='StudentsPerformance.csv', cache_dir=DEFAULT_CACHE_DIR, repeats=5):
+    """Memory and load time of plain read_csv vs the compact loader (cold and cached)"""
+    def best_time(fn):
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - start)
+        return best, result
+
+    def plain():
+        # The original path: default dtypes, then the derived columns
+        df = pd.read_csv(filepath)
+        df.columns = [clean_column_name(col) for col in df.columns]
+        df['total_score'] = df['math_score'] + df['reading_score'] + df['writing_score']
+        df['average_score'] = df['total_score'] / 3
+        return df
+
+    plain_seconds, plain_df = best_time(plain)
+    compact_seconds, (compact_df, _) = best_time(lambda: load_students(filepath, None))
+    load_students(filepath, cache_dir)  # make sure the cache entry exists
+    cached_seconds, _ = best_time(lambda: load_students(filepath, cache_dir))
+
+    plain_mb = plain_df.memory_usage(deep=True).sum() / 1e6
+    compact_mb = compact_df.memory_usage(deep=True).sum() / 1e6
+    results = {
+        'rows': len(plain_df),
+        'read_csv_mb': plain_mb,
+        'compact_mb': compact_mb,
+        'memory_reduction': plain_mb / compact_mb,
+        'read_csv_seconds': plain_seconds,
+        'compact_csv_seconds': compact_seconds,
+        'cached_seconds': cached_seconds,
+        'reload_speedup': plain_seconds / cached_seconds
+    }
+    print(f"Loader comparison ({results['rows']:,} rows):")
+    print(f"  read_csv:      {plain_mb:8.2f} MB  {plain_seconds * 1000:8.1f} ms")
+    print(f"  compact CSV:   {compact_mb:8.2f} MB  {compact_seconds * 1000:8.1f} ms")
+    print(f"  compact cache: {compact_mb:8.2f} MB  {cached_seconds * 1000:8.1f} ms")
+    print(f"  Memory reduction: {results['memory_reduction']:.1f}x, "
+          f"reload speed-up: {results['reload_speedup']:.1f}x")
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Compare plain and compact student loaders")
+    parser.add_argument('csv', nargs='?', default='StudentsPerformance.csv')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+    compare_loaders(args.csv, args.cache_dir)
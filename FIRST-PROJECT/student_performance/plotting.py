@@ -0,0 +1,227 @@
+"""
+Plotting
+Optional matplotlib/seaborn backend for StudentPerformanceAnalysis; imported only when a chart is requested
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+# Set up matplotlib style
+plt.style.use('seaborn-v0_8')
+sns.set_palette("husl")
+
+SUBJECT_COLORS = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+
+
+def _grouped_subject_bars(scores, xlabel, title):
+    """Math/reading/writing bars side by side for each group"""
+    x = np.arange(len(scores.index))
+    width = 0.25
+
+    plt.bar(x - width, scores['math_score'], width, label='Math', color=SUBJECT_COLORS[0])
+    plt.bar(x, scores['reading_score'], width, label='Reading', color=SUBJECT_COLORS[1])
+    plt.bar(x + width, scores['writing_score'], width, label='Writing', color=SUBJECT_COLORS[2])
+
+    plt.xlabel(xlabel)
+    plt.ylabel('Average Score')
+    plt.title(title, fontsize=14, fontweight='bold')
+    plt.xticks(x, scores.index)
+    plt.legend()
+
+
+def _scatter(analysis, x, y, color):
+    """Scatter of two scores; a density image of the joint histogram in streaming mode"""
+    if analysis.streaming:
+        counts = analysis.accumulator.joint_histograms[(x, y)]
+        plt.imshow(np.ma.masked_equal(counts.T, 0), origin='lower', cmap='RdPu',
+                   extent=(-0.5, counts.shape[0] - 0.5, -0.5, counts.shape[1] - 0.5))
+        plt.colorbar(label='Students', shrink=0.8)
+    else:
+        plt.scatter(analysis.data[x], analysis.data[y], alpha=0.7, color=color, s=30,
+                    edgecolors='black', linewidth=0.5)
+
+
+def _histogram_boxplot(accumulator):
+    """Box plot by test preparation and subject from exact score histograms"""
+    from .streaming import _histogram_quantile, MAX_SCORE
+
+    values = np.arange(MAX_SCORE + 1)
+    palette = sns.color_palette()
+    width = 0.8 / 3
+    levels = list(accumulator.subject_histograms)
+    for i, level in enumerate(levels):
+        for j, counts in enumerate(accumulator.subject_histograms[level]):
+            q1, median, q3 = (_histogram_quantile(counts, q) for q in (0.25, 0.5, 0.75))
+            present = values[counts > 0]
+            inside = present[(present >= q1 - 1.5 * (q3 - q1)) & (present <= q3 + 1.5 * (q3 - q1))]
+            stats = {'q1': q1, 'med': median, 'q3': q3, 'whislo': inside.min(),
+                     'whishi': inside.max(), 'fliers': present[(present < inside.min())
+                                                              | (present > inside.max())]}
+            box = plt.gca().bxp([stats], positions=[i + (j - 1) * width], widths=width * 0.9,
+                                patch_artist=True, manage_ticks=False)
+            box['boxes'][0].set_facecolor(palette[j])
+    plt.xticks(range(len(levels)), levels)
+    plt.legend(handles=[plt.Rectangle((0, 0), 1, 1, color=palette[j]) for j in range(3)],
+               labels=['math_score', 'reading_score', 'writing_score'], title='subject')
+
+
+def subject_figure(analysis):
+    """VISUALIZATION 1: Subject Performance and Correlations"""
+    fig = plt.figure(figsize=(16, 12))
+
+    # 1. Bar Chart - Average Scores by Subject
+    plt.subplot(2, 2, 1)
+    subjects = ['Math', 'Reading', 'Writing']
+    averages = analysis.subject_averages.tolist()
+    bars = plt.bar(subjects, averages, color=SUBJECT_COLORS)
+    plt.title('Average Scores by Subject', fontsize=14, fontweight='bold')
+    plt.ylabel('Average Score')
+    plt.ylim(0, 100)
+    for i, bar in enumerate(bars):
+        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
+                 f'{averages[i]:.1f}', ha='center', va='bottom', fontweight='bold')
+
+    # 2. Scatter Plot - Math vs Reading Scores
+    plt.subplot(2, 2, 2)
+    _scatter(analysis, 'math_score', 'reading_score', '#FF1493')
+    plt.xlabel('Math Score')
+    plt.ylabel('Reading Score')
+    plt.title('Math vs Reading Scores', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3)
+    correlation = analysis.correlation_matrix.loc['math_score', 'reading_score']
+    plt.text(0.05, 0.95, f'Correlation: {correlation:.3f}',
+             transform=plt.gca().transAxes, bbox=dict(boxstyle="round", facecolor='white', alpha=0.8))
+
+    # 3. Scatter Plot - Reading vs Writing Scores
+    plt.subplot(2, 2, 3)
+    _scatter(analysis, 'reading_score', 'writing_score', '#8B4513')
+    plt.xlabel('Reading Score')
+    plt.ylabel('Writing Score')
+    plt.title('Reading vs Writing Scores', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3)
+    correlation_rw = analysis.correlation_matrix.loc['reading_score', 'writing_score']
+    plt.text(0.05, 0.95, f'Correlation: {correlation_rw:.3f}',
+             transform=plt.gca().transAxes, bbox=dict(boxstyle="round", facecolor='white', alpha=0.8))
+
+    # 4. Heatmap - Correlation Matrix
+    plt.subplot(2, 2, 4)
+    custom_labels = ['Math\nScore', 'Reading\nScore', 'Writing\nScore', 'Total\nScore']
+    sns.heatmap(analysis.correlation_matrix, annot=True, cmap='coolwarm', center=0,
+                square=True, fmt='.3f', cbar_kws={'shrink': 0.8},
+                xticklabels=custom_labels, yticklabels=custom_labels)
+    plt.title('Score Correlation Heatmap', fontsize=14, fontweight='bold')
+    plt.xlabel('Subjects', fontsize=12)
+    plt.ylabel('Subjects', fontsize=12)
+    plt.xticks(rotation=0, ha='center')
+    plt.yticks(rotation=0)
+
+    plt.tight_layout(pad=4.0, w_pad=3.0, h_pad=3.0)
+    return fig
+
+
+def demographic_figure(analysis):
+    """VISUALIZATION 2: Demographic Analysis"""
+    from .analysis import FACTORS
+
+    fig = plt.figure(figsize=(15, 10))
+
+    # 1. Bar Chart - Average Scores by Gender
+    plt.subplot(2, 2, 1)
+    _grouped_subject_bars(analysis.gender_scores, 'Gender', 'Average Scores by Gender')
+
+    # 2. Bar Chart - Average Scores by Parental Education
+    plt.subplot(2, 2, 2)
+    education_scores = analysis.education_scores
+    plt.bar(range(len(education_scores)), education_scores.values, color='#96CEB4')
+    plt.xlabel('Parental Education Level')
+    plt.ylabel('Average Score')
+    plt.title('Average Scores by Parental Education', fontsize=14, fontweight='bold')
+    plt.xticks(range(len(education_scores)),
+               [label.replace(' ', '\n') for label in education_scores.index],
+               rotation=0, ha='center')
+
+    # 3. Heatmap - Average Scores by Gender and Race/Ethnicity
+    plt.subplot(2, 2, 3)
+    sns.heatmap(analysis.gender_race_pivot, annot=True, cmap='YlOrRd', fmt='.1f', cbar_kws={'shrink': 0.8})
+    plt.title('Average Scores by Gender and Race/Ethnicity', fontsize=14, fontweight='bold')
+
+    # 4. Performance comparison across different factors
+    plt.subplot(2, 2, 4)
+    plt.bar(list(FACTORS.values()), analysis.factor_effects[list(FACTORS)].values,
+            color=['#FF7675', '#74B9FF', '#00B894'])
+    plt.xlabel('Factors')
+    plt.ylabel('Score Difference (Max - Min)')
+    plt.title('Impact of Different Factors on Performance', fontsize=14, fontweight='bold')
+
+    plt.tight_layout(pad=3.0)
+    return fig
+
+
+def distribution_figure(analysis):
+    """VISUALIZATION 3: Distribution Analysis"""
+    streaming = analysis.streaming
+    fig = plt.figure(figsize=(15, 10))
+
+    # 1. Distribution of Total Scores
+    plt.subplot(2, 2, 1)
+    if streaming:
+        # Same 30 bins over the observed range, weighted by the exact histogram
+        acc = analysis.accumulator
+        lowest, highest = analysis.total_score_range
+        total_mean = acc.sums[-1, -1] / acc.pair_counts[-1, -1]
+        plt.hist(np.arange(len(acc.total_histogram)), bins=np.linspace(lowest, highest, 31),
+                 weights=acc.total_histogram, color='#74B9FF', alpha=0.7, edgecolor='black')
+    else:
+        total_mean = analysis.data['total_score'].mean()
+        plt.hist(analysis.data['total_score'], bins=30, color='#74B9FF', alpha=0.7, edgecolor='black')
+    plt.xlabel('Total Score')
+    plt.ylabel('Frequency')
+    plt.title('Distribution of Total Scores', fontsize=14, fontweight='bold')
+    plt.axvline(total_mean, color='red', linestyle='--', linewidth=2,
+                label=f'Mean: {total_mean:.1f}')
+    plt.legend()
+
+    # 2. Box Plot - Scores by Test Preparation
+    plt.subplot(2, 2, 2)
+    if streaming:
+        _histogram_boxplot(analysis.accumulator)
+    else:
+        df_melted = analysis.data.melt(id_vars=['test_preparation_course'],
+                                       value_vars=['math_score', 'reading_score', 'writing_score'],
+                                       var_name='subject', value_name='score')
+        sns.boxplot(data=df_melted, x='test_preparation_course', y='score', hue='subject')
+    plt.title('Score Distribution by Test Preparation', fontsize=14, fontweight='bold')
+    plt.xlabel('Test Preparation Course')
+    plt.ylabel('Score')
+
+    # 3. Bar Chart - Average Scores by Lunch Type
+    plt.subplot(2, 2, 3)
+    _grouped_subject_bars(analysis.lunch_scores, 'Lunch Type', 'Average Scores by Lunch Type')
+
+    # 4. Bar Chart - Average Scores by Race/Ethnicity
+    plt.subplot(2, 2, 4)
+    race_scores = analysis.race_scores
+    plt.bar(range(len(race_scores)), race_scores.values, color='#DDA0DD')
+    plt.xlabel('Race/Ethnicity')
+    plt.ylabel('Average Score')
+    plt.title('Average Scores by Race/Ethnicity', fontsize=14, fontweight='bold')
+    plt.xticks(range(len(race_scores)), race_scores.index, rotation=45, ha='right')
+
+    plt.tight_layout(pad=3.0)
+    return fig
+
+
+# Figure builders in report order
+FIGURES = {
+    'subjects': subject_figure,
+    'demographics': demographic_figure,
+    'distributions': distribution_figure
+}
+
+
+def show_all(analysis):
+    """Build and show each figure set in turn, as the original script did"""
+    for build in FIGURES.values():
+        build(analysis)
+        plt.show()
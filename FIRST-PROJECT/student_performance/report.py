@@ -0,0 +1,151 @@
+"""
+Report
+Headless report generation: figures rendered with Agg on a process pool, plus JSON and HTML summaries
+"""
+
+import argparse
+import html
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .analysis import StudentPerformanceAnalysis, FACTORS
+from .streaming import StreamingStudentAnalysis
+
+FIGURE_NAMES = ['subjects', 'demographics', 'distributions']
+DEFAULT_FORMATS = ('png', 'svg')
+DEFAULT_OUTPUT = 'reports'
+
+def _init_worker():
+    """Select the non-interactive backend before pyplot is imported"""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def report_dir(csv_path, output_root):
+    """Output directory for one CSV: <output_root>/<file name without extension>"""
+    return os.path.join(output_root, os.path.splitext(os.path.basename(csv_path))[0])
+
+
+def load_analysis(csv_path, chunksize=None):
+    """In-memory analysis, or the streaming one when ``chunksize`` is set"""
+    if chunksize:
+        return StreamingStudentAnalysis(csv_path, chunksize)
+    return StudentPerformanceAnalysis(csv_path)
+
+
+def _render_report(csv_path, output_dir, formats, chunksize=None):
+    """Worker: analyse one CSV once, save every figure set in every format and the summaries"""
+    import matplotlib.pyplot as plt
+    from . import plotting
+
+    analysis = load_analysis(csv_path, chunksize)
+    paths = []
+    for name in FIGURE_NAMES:
+        fig = plotting.FIGURES[name](analysis)
+        for fmt in formats:
+            path = os.path.join(output_dir, f'{name}.{fmt}')
+            fig.savefig(path, format=fmt, dpi=100)
+            paths.append(path)
+        plt.close(fig)
+    write_summary(analysis, csv_path, output_dir, formats)
+    return csv_path, paths
+
+
+def summarize(analysis):
+    """JSON-friendly statistics behind the figures and insights"""
+    def table(frame):
+        return {str(k): v for k, v in frame.round(4).to_dict(orient='index').items()}
+
+    return {
+        'students': analysis.n_students,
+        'overall': table(analysis.overall),
+        'correlations': table(analysis.correlation_matrix),
+        'by_gender': table(analysis.performance_by('gender')),
+        'by_race_ethnicity': table(analysis.performance_by('race_ethnicity')),
+        'by_parental_education': table(analysis.performance_by('parental_level_of_education')),
+        'by_lunch': table(analysis.performance_by('lunch')),
+        'by_test_preparation': table(analysis.performance_by('test_preparation_course')),
+        'factor_effects': {FACTORS[k]: round(float(v), 4) for k, v in analysis.factor_effects.items()}
+    }
+
+
+def write_summary(analysis, csv_path, output_dir, formats):
+    """Write summary.json and an index.html that embeds the rendered figures"""
+    summary = summarize(analysis)
+    summary['source'] = csv_path
+    with open(os.path.join(output_dir, 'summary.json'), 'w') as f:
+        json.dump(summary, f, indent=2)
+
+    # Browsers only display the image formats in <img>; others (e.g. pdf) are linked
+    image_format = next((fmt for fmt in ('svg', 'png') if fmt in formats), None)
+    sections = ['<h2>Figures</h2>']
+    for name in FIGURE_NAMES:
+        if image_format:
+            sections.append(f'<img src="{name}.{image_format}" alt="{name}" style="max-width:100%">')
+        links = [f'<a href="{name}.{fmt}">{fmt.upper()}</a>' for fmt in formats if fmt != image_format]
+        if links:
+            sections.append(f'<p>{html.escape(name.title())}: ' + ' | '.join(links) + '</p>')
+    sections.append('<h2>Overall</h2>' + analysis.overall.round(2).to_html())
+    for dimension in ('gender', 'race_ethnicity', 'parental_level_of_education',
+                      'lunch', 'test_preparation_course'):
+        title = html.escape(dimension.replace('_', ' ').title())
+        sections.append(f'<h2>By {title}</h2>' + analysis.performance_by(dimension).round(2).to_html())
+
+    with open(os.path.join(output_dir, 'index.html'), 'w') as f:
+        f.write('<!DOCTYPE html>\n<html><head><meta charset="utf-8">'
+                f'<title>Student Performance Report - {html.escape(os.path.basename(csv_path))}</title>'
+                '</head><body>\n'
+                f'<h1>Student Performance Report: {html.escape(os.path.basename(csv_path))}</h1>\n'
+                f'<p>{summary["students"]} students</p>\n'
+                + '\n'.join(sections) + '\n</body></html>\n')
+    return summary
+
+
+def generate_reports(csv_paths, output_root=DEFAULT_OUTPUT, formats=DEFAULT_FORMATS,
+                     max_workers=None, chunksize=None):
+    """Render reports for many CSVs (e.g. one per school) in parallel
+
+    Each CSV is one task on the process pool: the worker reads and analyses
+    the file once, then renders all figure sets and writes the summaries
+    from that analysis. The parent never imports matplotlib. With
+    ``chunksize`` set, inputs are read in chunks in constant memory (see
+    streaming.py). Returns {csv_path: output_dir}.
+    """
+    formats = tuple(formats)
+    start = time.perf_counter()
+    output_dirs = {csv_path: report_dir(csv_path, output_root) for csv_path in csv_paths}
+    if len(set(output_dirs.values())) < len(output_dirs):
+        raise ValueError("Input files must have distinct names; reports are written to "
+                         "<output>/<file name>")
+
+    for directory in output_dirs.values():
+        os.makedirs(directory, exist_ok=True)
+
+    max_workers = max(1, min(max_workers or os.cpu_count(), len(csv_paths)))
+    print(f"Rendering {len(csv_paths)} reports x {len(FIGURE_NAMES)} figures "
+          f"on {max_workers} processes...")
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as pool:
+        futures = [pool.submit(_render_report, csv_path, output_dirs[csv_path], formats, chunksize)
+                   for csv_path in csv_paths]
+        for future in futures:
+            future.result()
+
+    print(f"Wrote {len(csv_paths)} reports to {output_root}/ "
+          f"in {time.perf_counter() - start:.1f}s")
+    return output_dirs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless student performance reports")
+    parser.add_argument('csv', nargs='+', help="input CSV files, one report each")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="output root directory")
+    parser.add_argument('--formats', nargs='+', default=list(DEFAULT_FORMATS),
+                        choices=['png', 'svg', 'pdf'])
+    parser.add_argument('--workers', type=int, help="worker processes (default: all cores)")
+    parser.add_argument('--chunksize', type=int,
+                        help="read inputs in chunks of this many rows (constant memory)")
+    args = parser.parse_args()
+
+    generate_reports(args.csv, args.output, args.formats, args.workers, args.chunksize)
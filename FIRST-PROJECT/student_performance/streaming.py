@@ -0,0 +1,221 @@
+"""
+Streaming
+Chunked, constant-memory analysis of StudentsPerformance-style CSVs using mergeable accumulators
+"""
+
+from functools import cached_property
+import numpy as np
+import pandas as pd
+
+from .aggregates import ScoreAggregates
+from .analysis import StudentPerformanceAnalysis, SUBJECTS, NUMERIC_COLUMNS, clean_column_name
+
+DEFAULT_CHUNKSIZE = 100000
+
+# Scores are integers 0-100, so one histogram bin per possible value is exact
+MAX_SCORE = 100
+MAX_TOTAL = 3 * MAX_SCORE
+
+# Score pairs drawn as scatter plots; kept as joint histograms
+SCORE_PAIRS = [('math_score', 'reading_score'), ('reading_score', 'writing_score')]
+
+
+def _histogram_quantile(counts, q):
+    """Quantile with linear interpolation (as pandas) from per-integer counts"""
+    cumulative = np.cumsum(counts)
+    position = (cumulative[-1] - 1) * q
+    lower = int(np.floor(position))
+    low_value = np.searchsorted(cumulative, lower, side='right')
+    high_value = np.searchsorted(cumulative, min(lower + 1, cumulative[-1] - 1), side='right')
+    return low_value + (position - lower) * (high_value - low_value)
+
+
+class ScoreAccumulator:
+    """Mergeable per-chunk state for every statistic and plot input of the report
+
+    Holds the grouped aggregates grid, pairwise co-moments of the numeric
+    columns (for correlations; each pair over the rows where both are
+    present, as DataFrame.corr does), exact integer histograms of each subject per test
+    preparation group and of the total score, joint histograms for the
+    scatter plots, missing-value counts and the first rows. Its size depends
+    on the number of categories and score values, not on the number of rows.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.aggregates = None
+        # [i, j] entries are over rows where columns i and j are both present
+        shape = (len(NUMERIC_COLUMNS), len(NUMERIC_COLUMNS))
+        self.pair_counts = np.zeros(shape)
+        self.sums = np.zeros(shape)
+        self.squares = np.zeros(shape)
+        self.cross = np.zeros(shape)
+        self.subject_histograms = {}
+        self.total_histogram = np.zeros(MAX_TOTAL + 1, dtype=np.int64)
+        self.joint_histograms = {pair: np.zeros((MAX_SCORE + 1, MAX_SCORE + 1), dtype=np.int64)
+                                 for pair in SCORE_PAIRS}
+        self.missing = None
+        self.head = None
+        self.dtypes = None
+        self.source_columns = None
+
+    def update(self, chunk):
+        """Add a raw chunk (original column names) and return self"""
+        if self.head is None:
+            self.source_columns = chunk.columns.tolist()
+            self.head = chunk.head()
+            self.dtypes = chunk.dtypes
+            self.missing = chunk.isnull().sum()
+        elif len(self.head) < 5:
+            self.head = pd.concat([self.head, chunk.head(5 - len(self.head))])
+            self.missing += chunk.isnull().sum()
+        else:
+            self.missing += chunk.isnull().sum()
+
+        df = chunk.set_axis([clean_column_name(col) for col in chunk.columns], axis=1)
+        df['total_score'] = df['math_score'] + df['reading_score'] + df['writing_score']
+        df['average_score'] = df['total_score'] / 3
+
+        part = ScoreAggregates.from_frame(df)
+        self.aggregates = part if self.aggregates is None else self.aggregates.merge(part)
+
+        values = df[NUMERIC_COLUMNS].to_numpy(dtype=np.float64)
+        present = (~np.isnan(values)).astype(np.float64)
+        values = np.where(present > 0, values, 0.0)
+        self.rows += len(df)
+        self.pair_counts += present.T @ present
+        self.sums += values.T @ present
+        self.squares += (values ** 2).T @ present
+        self.cross += values.T @ values
+
+        # Missing scores are left out; present ones must fit the integer bins
+        scores = df[SUBJECTS].to_numpy(dtype=np.float64)
+        observed = ~np.isnan(scores)
+        known = scores[observed]
+        if known.size and (known.min() < 0 or known.max() > MAX_SCORE
+                           or (known != np.round(known)).any()):
+            raise ValueError(f"Scores must be whole numbers from 0 to {MAX_SCORE}")
+        scores = np.where(observed, scores, 0).astype(np.int64)
+        codes, levels = pd.factorize(df['test_preparation_course'])
+        for code, level in enumerate(levels):
+            histogram = self.subject_histograms.setdefault(
+                level, np.zeros((len(SUBJECTS), MAX_SCORE + 1), dtype=np.int64))
+            for j in range(len(SUBJECTS)):
+                rows = (codes == code) & observed[:, j]
+                histogram[j] += np.bincount(scores[rows, j], minlength=MAX_SCORE + 1)
+        complete = observed.all(axis=1)
+        self.total_histogram += np.bincount(scores[complete].sum(axis=1), minlength=MAX_TOTAL + 1)
+        for a, b in SCORE_PAIRS:
+            i, j = SUBJECTS.index(a), SUBJECTS.index(b)
+            both = observed[:, i] & observed[:, j]
+            cell = scores[both, i] * (MAX_SCORE + 1) + scores[both, j]
+            self.joint_histograms[(a, b)] += np.bincount(
+                cell, minlength=(MAX_SCORE + 1) ** 2).reshape(MAX_SCORE + 1, MAX_SCORE + 1)
+        return self
+
+    def merge(self, other):
+        """Combine two accumulators (e.g. from different files or workers)"""
+        merged = ScoreAccumulator()
+        first, second = (self, other) if self.head is not None else (other, self)
+        merged.rows = self.rows + other.rows
+        merged.aggregates = (first.aggregates if second.aggregates is None
+                             else first.aggregates.merge(second.aggregates))
+        merged.pair_counts = self.pair_counts + other.pair_counts
+        merged.sums = self.sums + other.sums
+        merged.squares = self.squares + other.squares
+        merged.cross = self.cross + other.cross
+        for source in (self, other):
+            for level, histogram in source.subject_histograms.items():
+                merged.subject_histograms[level] = (
+                    merged.subject_histograms.get(level, 0) + histogram)
+        merged.total_histogram = self.total_histogram + other.total_histogram
+        merged.joint_histograms = {pair: self.joint_histograms[pair] + other.joint_histograms[pair]
+                                   for pair in SCORE_PAIRS}
+        merged.head, merged.dtypes, merged.source_columns = first.head, first.dtypes, first.source_columns
+        merged.missing = (first.missing if second.missing is None
+                          else first.missing + second.missing)
+        return merged
+
+    def correlation_matrix(self):
+        """Pearson correlations of the numeric columns from the pairwise co-moments"""
+        n = self.pair_counts
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # sums[i, j] / n[i, j] is the mean of column i over rows where j is also present
+            mean = self.sums / n
+            cov = self.cross / n - mean * mean.T
+            var = self.squares / n - mean ** 2
+            corr = cov / np.sqrt(var * var.T)
+        return pd.DataFrame(corr, index=NUMERIC_COLUMNS, columns=NUMERIC_COLUMNS)
+
+    def describe(self):
+        """describe() of the score columns, from the exact integer histograms"""
+        stats = {}
+        for j, subject in enumerate(SUBJECTS):
+            counts = sum(histogram[j] for histogram in self.subject_histograms.values())
+            values = np.arange(MAX_SCORE + 1)
+            n = counts.sum()
+            mean = (counts * values).sum() / n
+            std = np.sqrt((counts * (values - mean) ** 2).sum() / (n - 1))
+            present = np.flatnonzero(counts)
+            stats[subject] = [n, mean, std, present[0],
+                              _histogram_quantile(counts, 0.25), _histogram_quantile(counts, 0.5),
+                              _histogram_quantile(counts, 0.75), present[-1]]
+        table = pd.DataFrame(stats, index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'],
+                             dtype=np.float64)
+        source = {clean_column_name(col): col for col in self.source_columns}
+        return table.rename(columns=source)
+
+
+class StreamingStudentAnalysis(StudentPerformanceAnalysis):
+    """StudentPerformanceAnalysis over a CSV read in chunks, keeping no rows
+
+    Printed statistics match the in-memory analysis. Plots that need
+    individual rows use their constant-size equivalents: joint histograms
+    instead of scatter points, and box plots computed from exact score
+    histograms instead of a melted frame.
+    """
+
+    streaming = True
+
+    def __init__(self, source='StudentsPerformance.csv', chunksize=DEFAULT_CHUNKSIZE):
+        super().__init__(source)
+        self.chunksize = chunksize
+
+    @cached_property
+    def accumulator(self):
+        accumulator = ScoreAccumulator()
+        for chunk in pd.read_csv(self.source, chunksize=self.chunksize):
+            accumulator.update(chunk)
+        return accumulator
+
+    @property
+    def data(self):
+        raise AttributeError("Rows are not kept in streaming mode; use the accumulator")
+
+    @cached_property
+    def aggregates(self):
+        return self.accumulator.aggregates
+
+    @cached_property
+    def correlation_matrix(self):
+        return self.accumulator.correlation_matrix()
+
+    @property
+    def n_students(self):
+        return self.accumulator.rows
+
+    @property
+    def total_score_range(self):
+        present = np.flatnonzero(self.accumulator.total_histogram)
+        return int(present[0]), int(present[-1])
+
+    def dataset_info(self):
+        acc = self.accumulator
+        return {
+            'shape': (acc.rows, len(acc.source_columns)),
+            'columns': acc.source_columns,
+            'head': acc.head,
+            'dtypes': acc.dtypes,
+            'missing': acc.missing,
+            'describe': acc.describe()
+        }
@@ -0,0 +1,66 @@
+"""
+Backend Benchmark
+Compare HousePriceModel estimator backends on accuracy, training time and latency
+"""
+
+import time
+import numpy as np
+import pandas as pd
+from model_training import HousePriceModel, ESTIMATOR_BACKENDS, DEFAULT_CACHE_DIR
+
+
+def benchmark_backends(backends=None, filepath='melb_data.csv', n_single=1000,
+                       batch_repeats=5):
+    """Train each backend on the same data and time training and inference
+
+    Single-row latency goes through predict_price one row at a time; batch
+    throughput uses predict_batch over the whole preprocessed dataset.
+    """
+    backends = backends or list(ESTIMATOR_BACKENDS)
+    results = []
+
+    for backend in backends:
+        model = HousePriceModel(backend=backend, prediction_cache_size=0)
+        df_model = model.load_and_preprocess_data(filepath, cache_dir=DEFAULT_CACHE_DIR)
+        X = df_model.drop('Price', axis=1).to_numpy(dtype=np.float64)
+
+        start = time.perf_counter()
+        r2, rmse, mae = model.train_model(df_model)
+        train_seconds = time.perf_counter() - start
+
+        model.predict_price(X[0])
+        timings = []
+        for row in X[:n_single]:
+            start = time.perf_counter()
+            model.predict_price(row)
+            timings.append(time.perf_counter() - start)
+        timings = np.array(timings) * 1000
+
+        rates = []
+        for _ in range(batch_repeats):
+            model.predict_batch(X)
+            rates.append(model.last_batch_stats['rows_per_second'])
+
+        results.append({
+            'backend': backend,
+            'r2': r2,
+            'rmse': rmse,
+            'mae': mae,
+            'train_seconds': train_seconds,
+            'single_p50_ms': np.percentile(timings, 50),
+            'single_p99_ms': np.percentile(timings, 99),
+            'batch_rows_per_second': np.median(rates)
+        })
+
+    results = pd.DataFrame(results).set_index('backend')
+    print("\nBackend Benchmark:")
+    print(results.to_string(float_format=lambda v: f"{v:,.4f}"))
+    return results
+
+
+if __name__ == "__main__":
+    print("="*50)
+    print("HOUSE PRICE BACKEND BENCHMARK")
+    print("="*50)
+
+    benchmark_backends()
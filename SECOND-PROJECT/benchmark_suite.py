@@ -0,0 +1,198 @@
+"""
+Benchmark Suite
+Repeatable training and inference benchmarks on synthetic data scaled up from melb_data.csv
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+from pipeline_profiler import _max_rss_mb
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+SYNTHETIC_DIR = 'benchmark_data'
+RESULTS_DIR = 'benchmark_results'
+
+# Rows generated and written per step, to keep generation memory bounded
+GENERATION_CHUNK = 1_000_000
+
+
+def generate_synthetic_dataset(n_rows, output_path, source='melb_data.csv', seed=42):
+    """Write an n_rows CSV by resampling the source rows with small noise
+
+    Rows are bootstrapped from the model columns of the source file; prices,
+    areas and coordinates get multiplicative or additive jitter so the data is
+    not just repeated. Missing values keep their source frequency.
+    """
+    from model_training import read_housing_csv
+
+    base = read_housing_csv(source, engine='c')
+    rng = np.random.default_rng(seed)
+    written = 0
+    first = True
+    while written < n_rows:
+        size = min(GENERATION_CHUNK, n_rows - written)
+        chunk = base.iloc[rng.integers(0, len(base), size)].reset_index(drop=True)
+        for col in ('Price', 'Landsize', 'BuildingArea'):
+            chunk[col] = (chunk[col] * rng.lognormal(0, 0.05, size)).round()
+        for col in ('Lattitude', 'Longtitude'):
+            chunk[col] = chunk[col] + rng.normal(0, 0.002, size)
+        chunk.to_csv(output_path, mode='w' if first else 'a', header=first, index=False)
+        written += size
+        first = False
+    return output_path
+
+
+def synthetic_path(n_rows, seed=42):
+    """Generate (once) and return the synthetic CSV for a size"""
+    os.makedirs(SYNTHETIC_DIR, exist_ok=True)
+    path = os.path.join(SYNTHETIC_DIR, f'melb_synthetic_{n_rows}_{seed}.csv')
+    if not os.path.exists(path):
+        print(f"Generating {n_rows:,} synthetic rows...")
+        generate_synthetic_dataset(n_rows, path, seed=seed)
+    return path
+
+
+def run_single_size(csv_path, n_single=1000):
+    """Benchmark one dataset in the current process and return the measurements"""
+    from model_training import HousePriceModel
+
+    model = HousePriceModel(prediction_cache_size=0)
+    start = time.perf_counter()
+    df_model = model.load_and_preprocess_data(csv_path)
+    preprocess_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model.train_model(df_model)
+    train_seconds = time.perf_counter() - start
+
+    X = df_model[model.feature_names].to_numpy(dtype=np.float64)
+    model.predict_price(X[0])
+    timings = []
+    for row in X[:n_single]:
+        t = time.perf_counter()
+        model.predict_price(row)
+        timings.append(time.perf_counter() - t)
+    timings = np.array(timings) * 1000
+
+    model.predict_batch(X)
+    batch_rows_per_second = model.last_batch_stats['rows_per_second']
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pkl_path = os.path.join(tmp, 'model.pkl')
+        npz_path = os.path.join(tmp, 'model.npz')
+        model.save_model(pkl_path)
+        model.export_bundle(npz_path)
+
+        # Cold start: each format is loaded in a fresh interpreter, imports included
+        from fast_predictor import benchmark_artifact_formats
+        artifacts = benchmark_artifact_formats(pkl_path, npz_path, n_predictions=100)
+        load_pkl_seconds = artifacts['joblib']['load_seconds']
+        load_npz_seconds = artifacts['npz']['load_seconds']
+
+    return {
+        'rows_after_preprocessing': len(df_model),
+        'preprocess_seconds': preprocess_seconds,
+        'train_seconds': train_seconds,
+        'single_p50_ms': float(np.percentile(timings, 50)),
+        'single_p90_ms': float(np.percentile(timings, 90)),
+        'single_p99_ms': float(np.percentile(timings, 99)),
+        'single_max_ms': float(timings.max()),
+        'batch_rows_per_second': batch_rows_per_second,
+        'load_pkl_seconds': load_pkl_seconds,
+        'load_npz_seconds': load_npz_seconds,
+        'peak_rss_mb': _max_rss_mb()
+    }
+
+
+def environment_info():
+    import sklearn
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'sklearn': sklearn.__version__
+    }
+
+
+def run_suite(sizes=DEFAULT_SIZES, output=None, seed=42):
+    """Benchmark every size in its own subprocess (so peak RSS is per size) and save JSON"""
+    results = {'timestamp': datetime.now().isoformat(timespec='seconds'),
+               'environment': environment_info(), 'sizes': {}}
+
+    for n_rows in sizes:
+        csv_path = synthetic_path(n_rows, seed)
+        print(f"Benchmarking {n_rows:,} rows...")
+        output_lines = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--worker', os.path.abspath(csv_path)],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip().splitlines()
+        results['sizes'][str(n_rows)] = json.loads(output_lines[-1])
+
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"benchmark_{datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print_results(results)
+    print(f"Results saved to {output}")
+    return results
+
+
+def print_results(results):
+    columns = ['preprocess_seconds', 'train_seconds', 'single_p50_ms', 'single_p99_ms',
+               'batch_rows_per_second', 'load_pkl_seconds', 'load_npz_seconds', 'peak_rss_mb']
+    table = pd.DataFrame(results['sizes']).T[columns]
+    print(table.to_string(float_format=lambda v: f"{v:,.3f}"))
+
+
+def compare_results(baseline_path, candidate_path):
+    """Print candidate/baseline ratios for every size and metric both runs share"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    with open(candidate_path) as f:
+        candidate = json.load(f)
+
+    rows = {}
+    for size, metrics in candidate['sizes'].items():
+        if size not in baseline['sizes']:
+            continue
+        rows[size] = {key: value / baseline['sizes'][size][key]
+                      for key, value in metrics.items()
+                      if isinstance(value, (int, float)) and baseline['sizes'][size].get(key)}
+    table = pd.DataFrame(rows).T
+    print(f"Ratios {candidate_path} / {baseline_path} (>1 means larger):")
+    print(table.to_string(float_format=lambda v: f"{v:.2f}x"))
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="House price benchmark suite")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--output', help="results JSON path (default: benchmark_results/)")
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CANDIDATE'),
+                        help="compare two results files instead of running")
+    parser.add_argument('--worker', metavar='CSV', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        import contextlib
+        with contextlib.redirect_stdout(sys.stderr):
+            measurements = run_single_size(args.worker)
+        print(json.dumps(measurements))
+    elif args.compare:
+        compare_results(*args.compare)
+    else:
+        run_suite(args.sizes, args.output)
@@ -0,0 +1,146 @@
+"""
+Drift Monitor
+Fixed-bin streaming histograms of scored inputs and predictions, compared with training-time references
+"""
+
+import threading
+import numpy as np
+
+DEFAULT_BINS = 20
+
+# Population stability index thresholds (common rule of thumb)
+PSI_WARNING = 0.1
+PSI_DRIFT = 0.2
+
+# Floor for empty-bin proportions so PSI stays finite
+_EPSILON = 1e-4
+
+
+def bin_edges(values, bins=DEFAULT_BINS):
+    """Interior bin edges for a reference sample
+
+    Low-cardinality columns (counts, encoded categories) get one bin per
+    distinct value; others get quantile edges, so each reference bin holds
+    roughly the same share of rows.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    uniques = np.unique(values)
+    if len(uniques) <= bins:
+        return (uniques[:-1] + uniques[1:]) / 2
+    return np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1]))
+
+
+def bin_counts(values, edges):
+    """Counts per bin (len(edges) + 1 bins) ignoring NaN"""
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    return np.bincount(np.searchsorted(edges, values, side='right'),
+                       minlength=len(edges) + 1)
+
+
+def build_reference(X, predictions, feature_names, bins=DEFAULT_BINS):
+    """Training-time reference histograms, JSON-friendly, saved with the model"""
+    X = np.asarray(X, dtype=np.float64)
+    columns = {name: X[:, i] for i, name in enumerate(feature_names)}
+    columns['prediction'] = np.asarray(predictions, dtype=np.float64)
+
+    reference = {}
+    for name, values in columns.items():
+        edges = bin_edges(values, bins)
+        reference[name] = {
+            'edges': edges.tolist(),
+            'counts': bin_counts(values, edges).tolist(),
+            'min': float(np.nanmin(values)),
+            'max': float(np.nanmax(values))
+        }
+    return reference
+
+
+def psi(expected, actual):
+    """Population stability index between two count vectors over the same bins"""
+    e = np.maximum(np.asarray(expected, dtype=np.float64) / max(np.sum(expected), 1), _EPSILON)
+    a = np.maximum(np.asarray(actual, dtype=np.float64) / max(np.sum(actual), 1), _EPSILON)
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+def ks_statistic(expected, actual):
+    """Kolmogorov-Smirnov distance between the binned CDFs (a lower bound on the exact KS)"""
+    e = np.cumsum(expected) / max(np.sum(expected), 1)
+    a = np.cumsum(actual) / max(np.sum(actual), 1)
+    return float(np.max(np.abs(a - e)))
+
+
+class DriftMonitor:
+    """Accumulate histograms of scored batches and compare them with the reference
+
+    Memory is one count vector per feature (O(bins)) regardless of how many
+    rows are scored. Besides drift, it counts data-quality issues: missing
+    values and values outside the training range.
+    """
+
+    def __init__(self, reference, feature_names):
+        self.reference = reference
+        self.feature_names = list(feature_names)
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.rows = 0
+            self.counts = {name: np.zeros(len(ref['edges']) + 1, dtype=np.int64)
+                           for name, ref in self.reference.items()}
+            self.missing = dict.fromkeys(self.reference, 0)
+            self.out_of_range = dict.fromkeys(self.reference, 0)
+
+    def update(self, X, predictions=None):
+        """Add one scored batch (2-D features in model order, optional predictions)"""
+        X = np.asarray(X, dtype=np.float64)
+        columns = {name: X[:, i] for i, name in enumerate(self.feature_names)}
+        if predictions is not None:
+            columns['prediction'] = np.asarray(predictions, dtype=np.float64)
+
+        # Bin outside the lock; only the additions are serialized
+        updates = {}
+        for name, values in columns.items():
+            ref = self.reference.get(name)
+            if ref is None:
+                continue
+            updates[name] = (bin_counts(values, ref['edges']),
+                             int(np.isnan(values).sum()),
+                             int(((values < ref['min']) | (values > ref['max'])).sum()))
+
+        with self.lock:
+            self.rows += len(X)
+            for name, (counts, missing, out_of_range) in updates.items():
+                self.counts[name] += counts
+                self.missing[name] += missing
+                self.out_of_range[name] += out_of_range
+
+    def report(self):
+        """PSI, binned KS and data-quality counts per feature, with a status flag"""
+        with self.lock:
+            report = {'rows': self.rows, 'features': {}}
+            for name, ref in self.reference.items():
+                counts = self.counts[name]
+                value = psi(ref['counts'], counts) if counts.sum() else 0.0
+                report['features'][name] = {
+                    'psi': value,
+                    'ks': ks_statistic(ref['counts'], counts) if counts.sum() else 0.0,
+                    'missing': self.missing[name],
+                    'out_of_range': self.out_of_range[name],
+                    'status': ('drift' if value >= PSI_DRIFT
+                               else 'warning' if value >= PSI_WARNING else 'ok')
+                }
+        report['drifted'] = [name for name, r in report['features'].items()
+                             if r['status'] == 'drift']
+        return report
+
+    def print_report(self):
+        report = self.report()
+        print(f"Drift Report ({report['rows']:,} rows scored):")
+        print(f"{'feature':<22}{'PSI':>8}{'KS':>8}{'missing':>9}{'out of range':>14}  status")
+        for name, r in report['features'].items():
+            print(f"{name:<22}{r['psi']:>8.3f}{r['ks']:>8.3f}{r['missing']:>9}"
+                  f"{r['out_of_range']:>14}  {r['status']}")
+        return report
@@ -0,0 +1,149 @@
+"""
+Fast Predictor
+Small NumPy-only model bundle and predictor that loads without importing sklearn
+"""
+
+import json
+import os
+import subprocess
+import sys
+import numpy as np
+from feature_pipeline import FeaturePipeline
+
+BUNDLE_VERSION = 1
+
+
+def save_bundle(model, filepath='house_price_model.npz'):
+    """Write a trained linear HousePriceModel as an .npz bundle
+
+    The bundle holds the coefficients, intercept, scaler mean/scale, feature
+    names and label-encoder classes as plain arrays (no pickled objects).
+    """
+    if not model.is_trained:
+        raise ValueError("Model must be trained first")
+    if not hasattr(model.model, 'coef_'):
+        raise ValueError("Only linear models can be exported as a bundle")
+    if model.spatial_index is not None:
+        raise ValueError("Models with spatial features cannot be exported as a bundle")
+    if model.regional_models is not None:
+        raise ValueError("Models with regional sub-models cannot be exported as a bundle")
+
+    arrays = {
+        'coef': np.asarray(model.model.coef_, dtype=np.float64),
+        'intercept': np.asarray(model.model.intercept_, dtype=np.float64),
+        'scaler_mean': np.asarray(model.scaler.mean_, dtype=np.float64),
+        'scaler_scale': np.asarray(model.scaler.scale_, dtype=np.float64),
+        'feature_names': np.array(model.feature_names, dtype=str)
+    }
+    for col, le in model.label_encoders.items():
+        arrays[f'classes__{col}'] = np.array(le.classes_, dtype=str)
+
+    metadata = {'version': BUNDLE_VERSION,
+                'preprocessing_stats': model.preprocessing_stats,
+                'feature_pipeline': model.feature_pipeline.to_dict()}
+    arrays['metadata'] = np.array(json.dumps(metadata, default=float))
+
+    np.savez(filepath, **arrays)
+    print(f"Model bundle saved to {filepath}")
+
+
+class NumpyPricePredictor:
+    """Linear price predictor backed by a bundle written with save_bundle"""
+
+    def __init__(self, coef, intercept, scaler_mean, scaler_scale,
+                 feature_names, encoder_classes=None, metadata=None):
+        self.coef = coef
+        self.intercept = float(intercept)
+        self.scaler_mean = scaler_mean
+        self.scaler_scale = scaler_scale
+        self.feature_names = list(feature_names)
+        self.encoder_classes = encoder_classes or {}
+        self.metadata = metadata or {}
+        self.feature_pipeline = None
+        if self.metadata.get('feature_pipeline'):
+            self.feature_pipeline = FeaturePipeline.from_dict(self.metadata['feature_pipeline'])
+
+    @classmethod
+    def load(cls, filepath='house_price_model.npz'):
+        """Load a bundle from disk"""
+        with np.load(filepath, allow_pickle=False) as data:
+            encoder_classes = {name[len('classes__'):]: data[name].tolist()
+                               for name in data.files if name.startswith('classes__')}
+            return cls(
+                coef=data['coef'],
+                intercept=data['intercept'],
+                scaler_mean=data['scaler_mean'],
+                scaler_scale=data['scaler_scale'],
+                feature_names=data['feature_names'].tolist(),
+                encoder_classes=encoder_classes,
+                metadata=json.loads(str(data['metadata']))
+            )
+
+    def predict_batch(self, features):
+        """Predict prices for a 2-D array of rows in model feature order"""
+        features = np.asarray(features, dtype=np.float64)
+        return ((features - self.scaler_mean) / self.scaler_scale) @ self.coef + self.intercept
+
+    def predict_price(self, house_features):
+        """Predict price for a single house"""
+        return float(self.predict_batch(np.asarray(house_features, dtype=np.float64)[None, :])[0])
+
+    def predict_houses(self, houses):
+        """Predict prices for raw houses through the bundled feature pipeline"""
+        if self.feature_pipeline is None:
+            raise ValueError("Bundle has no feature pipeline")
+        return self.predict_batch(self.feature_pipeline.transform(houses))
+
+
+# Run in a fresh interpreter so import costs are included in the load time
+_BENCHMARK_SCRIPT = r'''
+import json, sys, time
+start = time.perf_counter()
+fmt, path, n = sys.argv[1], sys.argv[2], int(sys.argv[3])
+if fmt == 'joblib':
+    from model_training import HousePriceModel
+    model = HousePriceModel(prediction_cache_size=0)
+    model.load_model(path)
+else:
+    from fast_predictor import NumpyPricePredictor
+    model = NumpyPricePredictor.load(path)
+load_seconds = time.perf_counter() - start
+
+import numpy as np
+row = [3, 10, 2, 2, 500, 150, 2000, -37.8, 144.96, 5000, 1, 2, 17, 1.0]
+model.predict_price(row)
+timings = []
+for _ in range(n):
+    t = time.perf_counter()
+    model.predict_price(row)
+    timings.append(time.perf_counter() - t)
+print(json.dumps({'load_seconds': load_seconds,
+                  'sklearn_imported': 'sklearn' in sys.modules,
+                  'p50_ms': float(np.percentile(timings, 50)) * 1000,
+                  'p99_ms': float(np.percentile(timings, 99)) * 1000}))
+'''
+
+
+def benchmark_artifact_formats(pkl_path='house_price_model.pkl',
+                               npz_path='house_price_model.npz', n_predictions=1000):
+    """Compare cold-start load time and single-row latency of both formats"""
+    results = {}
+    for fmt, path in (('joblib', pkl_path), ('npz', npz_path)):
+        output = subprocess.run(
+            [sys.executable, '-c', _BENCHMARK_SCRIPT, fmt, os.path.abspath(path),
+             str(n_predictions)],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout
+        results[fmt] = json.loads(output.strip().splitlines()[-1])
+
+    print("Artifact Format Comparison:")
+    for fmt, r in results.items():
+        print(f"{fmt:>6}: load {r['load_seconds'] * 1000:,.1f} ms "
+              f"(sklearn imported: {r['sklearn_imported']}), "
+              f"predict p50 {r['p50_ms']:.3f} ms, p99 {r['p99_ms']:.3f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_artifact_formats()
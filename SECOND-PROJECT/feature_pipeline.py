@@ -0,0 +1,140 @@
+"""
+Feature Pipeline
+Compiled raw-row -> model-input transform shared by training, the GUI, batch scoring and the server
+"""
+
+import numpy as np
+
+# Friendly names accepted for the dataset's single-letter property types
+TYPE_ALIASES = {'house': 'h', 'unit': 'u', 'townhouse': 't'}
+
+# String forms of missing categorical values; imputed with the training mode
+MISSING_TOKENS = {'', 'none', 'nan'}
+
+
+def add_derived_features(df, current_year):
+    """Add PropertyAge and RoomToBathroomRatio to a DataFrame in place"""
+    df['PropertyAge'] = current_year - df['YearBuilt']
+    df['RoomToBathroomRatio'] = df['Rooms'] / (df['Bathroom'] + 1)
+    return df
+
+
+class FeaturePipeline:
+    """Imputation values, encoder lookups and derived-feature logic in one object
+
+    ``transform`` maps raw houses (dicts, a list of dicts or a DataFrame with
+    the original column names and string categories) to the model's input
+    matrix in one vectorized pass using NumPy only.
+    """
+
+    def __init__(self, numerical_cols, categorical_cols, encoder_classes,
+                 current_year, medians=None, modes=None):
+        self.numerical_cols = list(numerical_cols)
+        self.categorical_cols = list(categorical_cols)
+        self.encoder_classes = {col: list(classes) for col, classes in encoder_classes.items()}
+        self.current_year = current_year
+        self.medians = dict(medians or {})
+        self.modes = dict(modes or {})
+        self.feature_names = (self.numerical_cols + self.categorical_cols
+                              + ['PropertyAge', 'RoomToBathroomRatio'])
+        # Optional SpatialPriceIndex; saved with the model file, not in to_dict()
+        self.spatial_index = None
+
+        # Case-insensitive lookup tables from category name to encoded value
+        self._lookups = {}
+        for col, classes in self.encoder_classes.items():
+            lookup = {str(name).lower(): code for code, name in enumerate(classes)}
+            if col == 'Type':
+                for alias, name in TYPE_ALIASES.items():
+                    if name in lookup:
+                        lookup[alias] = lookup[name]
+            self._lookups[col] = lookup
+
+    @classmethod
+    def from_model(cls, model, numerical_cols, categorical_cols, current_year):
+        """Build from a HousePriceModel's fitted encoders and preprocessing stats"""
+        stats = model.preprocessing_stats or {}
+        return cls(
+            numerical_cols, categorical_cols,
+            {col: le.classes_.tolist() for col, le in model.label_encoders.items()},
+            current_year, stats.get('medians'), stats.get('modes')
+        )
+
+    def to_dict(self):
+        """JSON-friendly representation, saved alongside the model"""
+        return {
+            'numerical_cols': self.numerical_cols,
+            'categorical_cols': self.categorical_cols,
+            'encoder_classes': self.encoder_classes,
+            'current_year': self.current_year,
+            'medians': self.medians,
+            'modes': self.modes
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def transform(self, houses):
+        """Map raw houses to a float64 matrix in model feature order"""
+        if isinstance(houses, dict):
+            houses = [houses]
+        columns = self._columns(houses)
+        n_rows = len(next(iter(columns.values()))) if columns else 0
+
+        out = np.empty((n_rows, len(self.feature_names)), dtype=np.float64)
+        for i, col in enumerate(self.numerical_cols):
+            values = np.array(columns[col], dtype=np.float64)
+            if col in self.medians:
+                values[np.isnan(values)] = self.medians[col]
+            elif np.isnan(values).any():
+                raise ValueError(f"Missing value for {col}")
+            out[:, i] = values
+
+        offset = len(self.numerical_cols)
+        for i, col in enumerate(self.categorical_cols):
+            out[:, offset + i] = self._encode(col, columns[col])
+
+        # Derived features, same definitions as add_derived_features
+        year_built = out[:, self.numerical_cols.index('YearBuilt')]
+        rooms = out[:, self.numerical_cols.index('Rooms')]
+        bathroom = out[:, self.numerical_cols.index('Bathroom')]
+        out[:, -2] = self.current_year - year_built
+        out[:, -1] = rooms / (bathroom + 1)
+        
+        if self.spatial_index is not None:
+            lat = out[:, self.numerical_cols.index('Lattitude')]
+            lon = out[:, self.numerical_cols.index('Longtitude')]
+            out = np.hstack([out, self.spatial_index.transform(lat, lon)])
+        return out
+
+    def transform_one(self, house):
+        """Map a single raw house to a 1-D feature row"""
+        return self.transform([house])[0]
+
+    def _columns(self, houses):
+        if hasattr(houses, 'columns'):
+            return {col: houses[col].to_numpy() if col in houses.columns
+                    else np.full(len(houses), None)
+                    for col in self.numerical_cols + self.categorical_cols}
+        return {col: [house.get(col) for house in houses]
+                for col in self.numerical_cols + self.categorical_cols}
+
+    def _encode(self, col, values):
+        """Encode a column once per distinct value, then broadcast"""
+        values = np.asarray(values, dtype=object).astype(str)
+        uniques, inverse = np.unique(values, return_inverse=True)
+        lookup = self._lookups[col]
+        fallback = lookup.get(str(self.modes.get(col, '')).lower())
+
+        codes = np.empty(len(uniques), dtype=np.float64)
+        for j, value in enumerate(uniques):
+            key = value.strip().lower()
+            code = lookup.get(key)
+            if code is None and key in MISSING_TOKENS:
+                code = fallback
+            if code is None:
+                raise ValueError(f"Unknown {col}: '{value}'. "
+                                 f"Expected one of: {', '.join(self.encoder_classes[col])}")
+            codes[j] = code
+        return codes[inverse]
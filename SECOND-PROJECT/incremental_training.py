@@ -0,0 +1,78 @@
+"""
+Incremental Training
+Mergeable sufficient statistics for refitting a scaled linear model on new data only
+"""
+
+import numpy as np
+
+
+class LinearSufficientStats:
+    """Row count, means and co-moment matrix of [features, target]
+
+    Chunks are combined with the pairwise update of Chan et al., so the state
+    stays (d+1) x (d+1) regardless of how many rows have been seen and no
+    precision is lost to subtracting large raw sums. From this state the
+    StandardScaler moments and the least-squares solution on scaled features
+    are recovered exactly.
+    """
+
+    def __init__(self, n_features):
+        self.n = 0
+        self.mean = np.zeros(n_features + 1)
+        self.comoment = np.zeros((n_features + 1, n_features + 1))
+
+    @classmethod
+    def from_data(cls, X, y):
+        stats = cls(np.asarray(X).shape[1])
+        stats.update(X, y)
+        return stats
+
+    def update(self, X, y):
+        """Add a chunk of rows"""
+        Z = np.column_stack([np.asarray(X, dtype=np.float64), np.asarray(y, dtype=np.float64)])
+        if len(Z) == 0:
+            return
+        chunk = LinearSufficientStats(Z.shape[1] - 1)
+        chunk.n = len(Z)
+        chunk.mean = Z.mean(axis=0)
+        centered = Z - chunk.mean
+        chunk.comoment = centered.T @ centered
+        self.merge(chunk)
+
+    def merge(self, other):
+        """Combine another set of statistics into this one"""
+        if other.n == 0:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.comoment = (self.comoment + other.comoment
+                         + np.outer(delta, delta) * (self.n * other.n / n))
+        self.mean = self.mean + delta * (other.n / n)
+        self.n = n
+
+    def scaler_moments(self):
+        """Feature mean, variance and scale as StandardScaler computes them"""
+        mean = self.mean[:-1]
+        var = np.diag(self.comoment)[:-1] / self.n
+        scale = np.sqrt(var)
+        scale[scale == 0] = 1.0
+        return mean, var, scale
+
+    def solve(self):
+        """Least-squares coefficients and intercept on standardized features"""
+        _, _, scale = self.scaler_moments()
+        sxx = self.comoment[:-1, :-1] / np.outer(scale, scale)
+        sxy = self.comoment[:-1, -1] / scale
+        coef = np.linalg.lstsq(sxx, sxy, rcond=None)[0]
+        return coef, self.mean[-1]
+
+    def to_dict(self):
+        return {'n': self.n, 'mean': self.mean, 'comoment': self.comoment}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls(len(data['mean']) - 1)
+        stats.n = data['n']
+        stats.mean = np.asarray(data['mean'], dtype=np.float64)
+        stats.comoment = np.asarray(data['comoment'], dtype=np.float64)
+        return stats
@@ -0,0 +1,86 @@
+"""
+Load Test
+Drive the local prediction server with concurrent single-row and bulk requests
+"""
+
+import argparse
+import json
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+SAMPLE_ROW = [3, 10, 2, 2, 500, 150, 2000, -37.8, 144.96, 5000, 0, 2, 17, 1.0]
+
+
+def post_json(url, payload):
+    """POST a JSON payload and return the decoded response"""
+    data = json.dumps(payload).encode()
+    req = urllib.request.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(req, timeout=30) as response:
+        return json.loads(response.read())
+
+
+def run_single_row_load(base_url, n_requests=2000, concurrency=32):
+    """Fire single-row requests from many threads and time each one"""
+    rng = np.random.default_rng(42)
+    rows = np.tile(SAMPLE_ROW, (n_requests, 1))
+    rows[:, 0] = rng.integers(1, 6, n_requests)
+    rows[:, 1] = rng.uniform(1, 30, n_requests)
+
+    def one_request(row):
+        start = time.perf_counter()
+        post_json(f'{base_url}/predict', {'features': row.tolist()})
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = np.array(list(pool.map(one_request, rows))) * 1000
+    elapsed = time.perf_counter() - start
+
+    return {
+        'requests': n_requests,
+        'concurrency': concurrency,
+        'requests_per_second': n_requests / elapsed,
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99))
+    }
+
+
+def run_bulk_load(base_url, n_requests=20, rows_per_request=10000):
+    """Send bulk requests one after another and report row throughput"""
+    payload = {'rows': [SAMPLE_ROW] * rows_per_request}
+    start = time.perf_counter()
+    for _ in range(n_requests):
+        post_json(f'{base_url}/predict/batch', payload)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'requests': n_requests,
+        'rows_per_request': rows_per_request,
+        'rows_per_second': n_requests * rows_per_request / elapsed
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Load test for prediction_server.py")
+    parser.add_argument('--url', default='http://127.0.0.1:5001')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    args = parser.parse_args()
+
+    single = run_single_row_load(args.url, args.requests, args.concurrency)
+    print("Single-row requests:")
+    print(f"  {single['requests_per_second']:,.0f} req/s at concurrency {single['concurrency']}, "
+          f"p50 {single['p50_ms']:.2f} ms, p99 {single['p99_ms']:.2f} ms")
+
+    bulk = run_bulk_load(args.url)
+    print("Bulk requests:")
+    print(f"  {bulk['rows_per_second']:,.0f} rows/s "
+          f"({bulk['rows_per_request']} rows per request)")
+
+    with urllib.request.urlopen(f'{args.url}/stats', timeout=30) as response:
+        server_stats = json.loads(response.read())
+    print("Server counters:")
+    for key, value in server_stats.items():
+        print(f"  {key}: {value:,.2f}" if isinstance(value, float) else f"  {key}: {value}")
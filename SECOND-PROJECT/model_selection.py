@@ -0,0 +1,161 @@
+"""
+Model Selection
+Parallel k-fold cross-validation over a grid of candidate regressors
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import KFold
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler, PolynomialFeatures
+from sklearn.linear_model import LinearRegression, Ridge, Lasso
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor
+from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
+
+# (name, estimator kind, parameters); built inside the worker processes
+DEFAULT_CANDIDATES = (
+    [('linear', 'linear', {})]
+    + [(f'ridge(alpha={a})', 'ridge', {'alpha': a}) for a in (0.1, 1.0, 10.0, 100.0)]
+    + [(f'lasso(alpha={a})', 'lasso', {'alpha': a}) for a in (10.0, 100.0, 1000.0)]
+    + [(f'poly{d}+ridge', 'poly_ridge', {'degree': d, 'alpha': 10.0}) for d in (2, 3)]
+    + [('random_forest', 'random_forest', {'n_estimators': 100, 'max_depth': 16}),
+       ('hist_gradient_boosting', 'hist_gradient_boosting', {'max_iter': 300})]
+)
+
+# Rows timed one at a time to estimate single-row predict latency
+LATENCY_SAMPLE = 50
+
+# Shared-memory views of the training data, set once per worker process
+_shared = {}
+
+
+def build_estimator(kind, params):
+    """Create a scaled sklearn pipeline for a candidate"""
+    if kind == 'linear':
+        estimator = LinearRegression()
+    elif kind == 'ridge':
+        estimator = Ridge(**params)
+    elif kind == 'lasso':
+        estimator = Lasso(max_iter=5000, **params)
+    elif kind == 'poly_ridge':
+        return make_pipeline(StandardScaler(),
+                             PolynomialFeatures(degree=params['degree'], include_bias=False),
+                             Ridge(alpha=params['alpha']))
+    elif kind == 'random_forest':
+        estimator = RandomForestRegressor(random_state=42, n_jobs=1, **params)
+    elif kind == 'hist_gradient_boosting':
+        estimator = HistGradientBoostingRegressor(random_state=42, **params)
+    else:
+        raise ValueError(f"Unknown estimator kind: {kind}")
+    return make_pipeline(StandardScaler(), estimator)
+
+
+def _share_array(array):
+    """Copy an array into a new shared-memory block"""
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _attach_shared(specs):
+    """Worker initializer: map the shared arrays without copying them"""
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _shared[key] = (shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf))
+
+
+def _evaluate_fold(candidate, fold):
+    """Fit one candidate on one fold and score it"""
+    name, kind, params = candidate
+    X = _shared['X'][1]
+    y = _shared['y'][1]
+    test_mask = _shared['folds'][1] == fold
+
+    estimator = build_estimator(kind, params)
+    start = time.perf_counter()
+    estimator.fit(X[~test_mask], y[~test_mask])
+    fit_seconds = time.perf_counter() - start
+
+    X_test = X[test_mask]
+    start = time.perf_counter()
+    y_pred = estimator.predict(X_test)
+    batch_seconds = time.perf_counter() - start
+
+    timings = []
+    for row in X_test[:LATENCY_SAMPLE]:
+        start = time.perf_counter()
+        estimator.predict(row[None, :])
+        timings.append(time.perf_counter() - start)
+
+    y_test = y[test_mask]
+    return {
+        'model': name,
+        'fold': fold,
+        'r2': r2_score(y_test, y_pred),
+        'rmse': np.sqrt(mean_squared_error(y_test, y_pred)),
+        'mae': mean_absolute_error(y_test, y_pred),
+        'fit_seconds': fit_seconds,
+        'batch_us_per_row': batch_seconds / len(X_test) * 1e6,
+        'single_row_ms': float(np.median(timings)) * 1000
+    }
+
+
+def run_model_selection(df_model, candidates=DEFAULT_CANDIDATES, n_splits=5,
+                        max_workers=None):
+    """Cross-validate every candidate on a process pool and rank the results
+
+    The feature matrix, target and fold assignment are placed in shared memory
+    once; each (candidate, fold) task reads them in place.
+    """
+    X = np.ascontiguousarray(df_model.drop('Price', axis=1).to_numpy(dtype=np.float64))
+    y = np.ascontiguousarray(df_model['Price'].to_numpy(dtype=np.float64))
+    folds = np.empty(len(X), dtype=np.int16)
+    kfold = KFold(n_splits=n_splits, shuffle=True, random_state=42)
+    for fold, (_, test_idx) in enumerate(kfold.split(X)):
+        folds[test_idx] = fold
+
+    blocks = []
+    try:
+        specs = {}
+        for key, array in (('X', X), ('y', y), ('folds', folds)):
+            shm, spec = _share_array(array)
+            blocks.append(shm)
+            specs[key] = spec
+
+        max_workers = max_workers or os.cpu_count()
+        print(f"Cross-validating {len(candidates)} candidates x {n_splits} folds "
+              f"on {max_workers} processes...")
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach_shared,
+                                 initargs=(specs,)) as pool:
+            futures = [pool.submit(_evaluate_fold, candidate, fold)
+                       for candidate in candidates for fold in range(n_splits)]
+            fold_results = [future.result() for future in futures]
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+    results = pd.DataFrame(fold_results).groupby('model', sort=False).mean()
+    results = results.drop(columns='fold')
+    # Accuracy per unit of latency, for picking a production model
+    results['r2_per_ms'] = results['r2'] / results['single_row_ms']
+    results = results.sort_values('rmse')
+
+    print("Model Selection Results (mean over folds):")
+    print(results.to_string(float_format=lambda v: f"{v:,.4f}"))
+    return results
+
+
+if __name__ == "__main__":
+    from model_training import HousePriceModel, DEFAULT_CACHE_DIR
+
+    print("="*50)
+    print("HOUSE PRICE MODEL SELECTION")
+    print("="*50)
+
+    df_model = HousePriceModel().load_and_preprocess_data(cache_dir=DEFAULT_CACHE_DIR)
+    run_model_selection(df_model)
@@ -2,123 +2,627 @@ import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression
+from sklearn.ensemble import HistGradientBoostingRegressor
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
 import joblib
+import os
+import time
 import warnings
+from streaming_stats import QuantileSketch, CategoryCounter
+from preprocessing_cache import PreprocessingCache
+from fast_predictor import save_bundle
+from feature_pipeline import FeaturePipeline, add_derived_features
+from incremental_training import LinearSufficientStats
+from spatial_features import SpatialPriceIndex, SPATIAL_FEATURES
+from pipeline_profiler import PipelineProfiler
+from out_of_core import FeatureMemmap, holdout_mask
+from prediction_cache import PredictionCache
+from quantized_inference import QuantizedLinearPredictor
+from regional_models import (RegionalModelSet, compare_with_global,
+                             DEFAULT_REGIONAL_DIR, DEFAULT_MIN_ROWS)
+from drift_monitor import DriftMonitor, build_reference
+from contextlib import nullcontext
 warnings.filterwarnings('ignore')
 
+# Features used by the model, in input order
+NUMERICAL_COLS = ['Rooms', 'Distance', 'Bathroom', 'Car', 'Landsize',
+                  'BuildingArea', 'YearBuilt', 'Lattitude', 'Longtitude', 'Propertycount']
+CATEGORICAL_COLS = ['Type', 'Regionname']
+FEATURES = NUMERICAL_COLS + CATEGORICAL_COLS
+
+# Compact dtypes for the columns the model reads; Price stays float64
+CSV_DTYPES = {col: 'float32' for col in NUMERICAL_COLS}
+CSV_DTYPES.update({col: 'category' for col in CATEGORICAL_COLS})
+CSV_DTYPES['Price'] = 'float64'
+
+# Reference year for the PropertyAge feature (dataset covers 2016-2017 sales)
+CURRENT_YEAR = 2017
+
+# Everything that changes the preprocessed frame; part of the cache key
+PREPROCESSING_PARAMS = {
+    'features': FEATURES,
+    'dtypes': CSV_DTYPES,
+    'current_year': CURRENT_YEAR,
+    'price_quantiles': (0.01, 0.99)
+}
+
+DEFAULT_CACHE_DIR = '.preprocess_cache'
+DEFAULT_MEMMAP_DIR = '.feature_memmap'
+
+# Estimator backends selectable with HousePriceModel(backend=...)
+ESTIMATOR_BACKENDS = {
+    'linear': lambda: LinearRegression(),
+    'hist_gradient_boosting': lambda: HistGradientBoostingRegressor(
+        max_iter=300, learning_rate=0.1, random_state=42
+    )
+}
+
 class HousePriceModel:
-    def __init__(self):
+    def __init__(self, backend='linear', spatial_features=False, profiler=None,
+                 prediction_cache_size=1024, prediction_cache_ttl=None):
+        if backend not in ESTIMATOR_BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. "
+                             f"Choose from: {', '.join(ESTIMATOR_BACKENDS)}")
+        self.backend = backend
+        self.spatial_features = spatial_features
+        self.spatial_index = None
         self.model = None
         self.scaler = None
         self.label_encoders = {}
         self.feature_names = None
         self.is_trained = False
+        self.last_batch_stats = None
+        self.preprocessing_stats = None
+        self.feature_pipeline = None
+        self.sufficient_stats = None
+        self.profiler = profiler
+        # Repeated predict_price calls with the same inputs; 0 disables
+        self.prediction_cache = (PredictionCache(prediction_cache_size, prediction_cache_ttl)
+                                 if prediction_cache_size else None)
+        # 'float64' (sklearn), or 'float32'/'fixed' for linear models
+        self.inference_precision = 'float64'
+        self.quantized_predictor = None
+        self.precision_calibration = None
+        # Optional RegionalModelSet; rows of unseen regions use the global model
+        self.regional_models = None
+        # Training-time histograms saved with the model, and the live monitor
+        self.drift_reference = None
+        self.drift_monitor = None
+        
+    def _stage(self, name):
+        """Profile a pipeline stage when a PipelineProfiler is attached"""
+        return self.profiler.stage(name) if self.profiler else nullcontext()
+    
+    def load_and_preprocess_data(self, filepath='melb_data.csv', cache_dir=None,
+                                 refresh_cache=False):
+        """Load and preprocess the Melbourne housing dataset
+        
+        With ``cache_dir`` set, the preprocessed frame is reused from the
+        on-disk cache when the source file and parameters are unchanged.
+        ``refresh_cache`` always preprocesses and rewrites the cache entry.
+        """
+        if cache_dir is not None:
+            cache = PreprocessingCache(cache_dir)
+            with self._stage('cache_read'):
+                key = cache.key(filepath, PREPROCESSING_PARAMS)
+                cached = None if refresh_cache else cache.load(key)
+            if cached is not None:
+                df_model, metadata = cached
+                self._restore_preprocessing_state(metadata)
+                print(f"Loaded preprocessed dataset from cache. Final shape: {df_model.shape}")
+                return df_model
         
-    def load_and_preprocess_data(self, filepath='melb_data.csv'):
-        """Load and preprocess the Melbourne housing dataset"""
         print("Loading dataset...")
-        df = pd.read_csv(filepath)
+        with self._stage('csv_read'):
+            df = read_housing_csv(filepath)
         
         # Remove rows with missing target
         df = df.dropna(subset=['Price'])
         
-        # Select essential features for prediction
-        features = [
-            'Rooms', 'Distance', 'Bathroom', 'Car', 'Landsize', 
-            'BuildingArea', 'YearBuilt', 'Lattitude', 'Longtitude', 
-            'Propertycount', 'Type', 'Regionname'
-        ]
+        df_model = df[FEATURES + ['Price']].copy()
         
-        df_model = df[features + ['Price']].copy()
+        # Imputation values, encoders and outlier bounds from the full frame
+        with self._stage('statistics'):
+            stats = {
+                'medians': {col: float(df_model[col].median()) for col in NUMERICAL_COLS},
+                'modes': {col: df_model[col].mode()[0] for col in CATEGORICAL_COLS},
+                'price_bounds': (float(df_model['Price'].quantile(0.01)),
+                                 float(df_model['Price'].quantile(0.99)))
+            }
+            for col in CATEGORICAL_COLS:
+                le = LabelEncoder()
+                le.fit(df_model[col].fillna(stats['modes'][col]))
+                self.label_encoders[col] = le
+        self.preprocessing_stats = stats
         
-        # Handle missing values
-        numerical_cols = ['Rooms', 'Distance', 'Bathroom', 'Car', 'Landsize', 
-                         'BuildingArea', 'YearBuilt', 'Lattitude', 'Longtitude', 'Propertycount']
+        df_model = self._apply_preprocessing(df_model, stats)
         
-        for col in numerical_cols:
-            if col in df_model.columns:
-                df_model[col] = df_model[col].fillna(df_model[col].median())
+        if cache_dir is not None:
+            with self._stage('cache_write'):
+                cache.save(key, df_model, self._preprocessing_state())
+        
+        print(f"Dataset preprocessed successfully. Final shape: {df_model.shape}")
+        return df_model
+    
+    def _preprocessing_state(self):
+        """JSON-friendly preprocessing statistics and encoder classes"""
+        return {
+            'stats': self.preprocessing_stats,
+            'label_encoders': {col: le.classes_.tolist()
+                               for col, le in self.label_encoders.items()}
+        }
+    
+    def _restore_preprocessing_state(self, state):
+        """Rebuild statistics and fitted encoders from _preprocessing_state output"""
+        stats = dict(state['stats'])
+        stats['price_bounds'] = tuple(stats['price_bounds'])
+        self.preprocessing_stats = stats
+        for col, classes in state['label_encoders'].items():
+            le = LabelEncoder()
+            le.classes_ = np.array(classes, dtype=object)
+            self.label_encoders[col] = le
+    
+    def compute_streaming_statistics(self, filepath='melb_data.csv', chunksize=100000,
+                                     sketch_capacity=200000):
+        """First pass over the CSV: build preprocessing statistics in bounded memory
+        
+        Medians and price quantiles come from fixed-size quantile sketches,
+        so memory depends on ``chunksize`` and ``sketch_capacity`` only.
+        """
+        print("Computing streaming statistics...")
+        sketches = {col: QuantileSketch(sketch_capacity) for col in NUMERICAL_COLS}
+        price_sketch = QuantileSketch(sketch_capacity)
+        counters = {col: CategoryCounter() for col in CATEGORICAL_COLS}
+        rows = 0
+        
+        for chunk in read_housing_csv(filepath, engine='c', chunksize=chunksize):
+            chunk = chunk.dropna(subset=['Price'])
+            rows += len(chunk)
+            for col in NUMERICAL_COLS:
+                sketches[col].update(chunk[col].to_numpy())
+            for col in CATEGORICAL_COLS:
+                counters[col].update(chunk[col])
+            price_sketch.update(chunk['Price'].to_numpy())
+        
+        stats = {
+            'medians': {col: sketches[col].median() for col in NUMERICAL_COLS},
+            'modes': {col: counters[col].mode() for col in CATEGORICAL_COLS},
+            'price_bounds': (price_sketch.quantile(0.01), price_sketch.quantile(0.99)),
+            'rows': rows
+        }
+        for col in CATEGORICAL_COLS:
+            le = LabelEncoder()
+            le.fit(counters[col].categories())
+            self.label_encoders[col] = le
+        self.preprocessing_stats = stats
+        
+        print(f"Statistics computed over {rows} rows")
+        return stats
+    
+    def iter_preprocessed_chunks(self, filepath='melb_data.csv', chunksize=100000,
+                                 sketch_capacity=200000):
+        """Yield preprocessed chunks of the dataset using a two-pass scan
+        
+        The first pass builds the statistics (see compute_streaming_statistics),
+        the second applies the same imputation, encoding, feature engineering
+        and outlier filtering as load_and_preprocess_data chunk by chunk.
+        """
+        stats = self.compute_streaming_statistics(filepath, chunksize, sketch_capacity)
+        
+        for chunk in read_housing_csv(filepath, engine='c', chunksize=chunksize):
+            chunk = chunk.dropna(subset=['Price'])
+            yield self._apply_preprocessing(chunk[FEATURES + ['Price']], stats)
+    
+    def _apply_preprocessing(self, df_model, stats):
+        """Impute, encode, engineer features and drop price outliers"""
+        df_model = df_model.copy()
+        
+        # Handle missing values
+        with self._stage('imputation'):
+            for col in NUMERICAL_COLS:
+                df_model[col] = df_model[col].fillna(stats['medians'][col])
+            for col in CATEGORICAL_COLS:
+                mode = stats['modes'][col]
+                # A chunk's categories are only the values seen in that chunk
+                if (isinstance(df_model[col].dtype, pd.CategoricalDtype)
+                        and mode not in df_model[col].cat.categories):
+                    df_model[col] = df_model[col].cat.add_categories([mode])
+                df_model[col] = df_model[col].fillna(mode)
         
         # Handle categorical variables
-        categorical_cols = ['Type', 'Regionname']
-        for col in categorical_cols:
-            if col in df_model.columns:
-                df_model[col] = df_model[col].fillna(df_model[col].mode()[0])
-                le = LabelEncoder()
-                df_model[col] = le.fit_transform(df_model[col])
-                self.label_encoders[col] = le
+        with self._stage('label_encoding'):
+            for col in CATEGORICAL_COLS:
+                df_model[col] = self.label_encoders[col].transform(df_model[col])
         
         # Feature engineering
-        current_year = 2017
-        df_model['PropertyAge'] = current_year - df_model['YearBuilt']
-        df_model['RoomToBathroomRatio'] = df_model['Rooms'] / (df_model['Bathroom'] + 1)
+        with self._stage('feature_engineering'):
+            add_derived_features(df_model, CURRENT_YEAR)
         
         # Remove outliers
-        Q1 = df_model['Price'].quantile(0.01)
-        Q99 = df_model['Price'].quantile(0.99)
-        df_model = df_model[(df_model['Price'] >= Q1) & (df_model['Price'] <= Q99)]
-        
-        print(f"Dataset preprocessed successfully. Final shape: {df_model.shape}")
+        with self._stage('outlier_filtering'):
+            low, high = stats['price_bounds']
+            df_model = df_model[(df_model['Price'] >= low) & (df_model['Price'] <= high)]
         return df_model
     
     def train_model(self, df_model):
-        """Train the linear regression model"""
-        print("Training model...")
+        """Train the model with the configured estimator backend"""
+        print(f"Training model ({self.backend})...")
         
         # Separate features and target
         X = df_model.drop('Price', axis=1)
         y = df_model['Price']
         
-        # Store feature names
-        self.feature_names = X.columns.tolist()
-        
         # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=42
-        )
+        with self._stage('split'):
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y, test_size=0.2, random_state=42
+            )
+        
+        # Nearest-neighbour price features, indexed on the training split only
+        if self.spatial_features:
+            with self._stage('spatial_features'):
+                self.spatial_index = SpatialPriceIndex().fit(
+                    X_train['Lattitude'], X_train['Longtitude'], y_train
+                )
+                X_train = self.spatial_index.add_features(X_train, exclude_self=True)
+                X_test = self.spatial_index.add_features(X_test)
+        
+        # Store feature names
+        self.feature_names = X_train.columns.tolist()
         
         # Scale features
-        self.scaler = StandardScaler()
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
+        with self._stage('scaling'):
+            self.scaler = StandardScaler()
+            X_train_scaled = self.scaler.fit_transform(X_train)
+            X_test_scaled = self.scaler.transform(X_test)
         
         # Train model
-        self.model = LinearRegression()
-        self.model.fit(X_train_scaled, y_train)
+        with self._stage('fit'):
+            self.model = ESTIMATOR_BACKENDS[self.backend]()
+            self.model.fit(X_train_scaled, y_train)
         
         # Evaluate model
-        y_test_pred = self.model.predict(X_test_scaled)
+        with self._stage('evaluation'):
+            y_test_pred = self.model.predict(X_test_scaled)
+            
+            # Calculate metrics
+            r2 = r2_score(y_test, y_test_pred)
+            rmse = np.sqrt(mean_squared_error(y_test, y_test_pred))
+            mae = mean_absolute_error(y_test, y_test_pred)
         
-        # Calculate metrics
-        r2 = r2_score(y_test, y_test_pred)
-        rmse = np.sqrt(mean_squared_error(y_test, y_test_pred))
-        mae = mean_absolute_error(y_test, y_test_pred)
+        with self._stage('drift_reference'):
+            self.drift_reference = build_reference(
+                X_train.to_numpy(dtype=np.float64), self.model.predict(X_train_scaled),
+                self.feature_names
+            )
         
         print(f"Model Performance:")
         print(f"R² Score: {r2:.4f}")
         print(f"RMSE: ${rmse:,.2f}")
         print(f"MAE: ${mae:,.2f}")
         
+        self.feature_pipeline = FeaturePipeline.from_model(
+            self, NUMERICAL_COLS, CATEGORICAL_COLS, CURRENT_YEAR
+        )
+        self.feature_pipeline.spatial_index = self.spatial_index
+        # Kept so new sales can be folded in without revisiting the training rows
+        if self.backend == 'linear':
+            self.sufficient_stats = LinearSufficientStats.from_data(X_train, y_train)
+        # Sub-models from an earlier run were fitted against a different split
+        self.regional_models = None
+        self.is_trained = True
+        self._clear_prediction_cache()
+        return r2, rmse, mae
+    
+    def update_model(self, new_data):
+        """Fold new sales into a trained linear model without a full refit
+        
+        ``new_data`` is a raw DataFrame (or CSV path) in the dataset's format.
+        Rows are preprocessed with the statistics from the original training
+        run; the running scaler moments and co-moment matrix are updated and
+        the coefficients re-solved, which costs time proportional to the new
+        rows only. The result matches refitting on the old plus new rows.
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained first")
+        if self.sufficient_stats is None:
+            raise ValueError("Model has no sufficient statistics; retrain it with "
+                             "the linear backend to enable incremental updates")
+        
+        if isinstance(new_data, str):
+            new_data = read_housing_csv(new_data)
+        new_data = new_data.dropna(subset=['Price'])
+        df_new = self._apply_preprocessing(new_data[FEATURES + ['Price']],
+                                           self.preprocessing_stats)
+        if len(df_new) == 0:
+            return 0
+        
+        if self.spatial_index is not None:
+            df_new = self.spatial_index.add_features(df_new)
+        X_new = df_new[self.feature_names].to_numpy(dtype=np.float64)
+        self.sufficient_stats.update(X_new, df_new['Price'].to_numpy(dtype=np.float64))
+        
+        self._apply_linear_solution()
+        # Sub-models do not see the new rows; retrain them with train_regional_models
+        if self.regional_models is not None:
+            print("Regional sub-models dropped; predictions use the updated global model")
+            self.regional_models = None
+        self._clear_prediction_cache()
+        
+        print(f"Model updated with {len(df_new)} new rows "
+              f"({self.sufficient_stats.n} rows in total)")
+        return len(df_new)
+    
+    def train_regional_models(self, df_model, directory=DEFAULT_REGIONAL_DIR,
+                              min_rows=DEFAULT_MIN_ROWS, max_workers=None):
+        """Fit one sub-model per Regionname in parallel and route predictions to them
+        
+        Sub-models use the same backend and features as the global model and
+        are fitted on the same training split, one process per region; regions
+        with fewer than ``min_rows`` training rows, or unseen at predict time,
+        fall back to the global model. Returns routed vs global test metrics.
+        """
+        if not self.is_trained:
+            raise ValueError("Train the global model first")
+        if self.spatial_index is not None:
+            raise ValueError("Regional models do not support spatial features")
+        
+        X = df_model[self.feature_names].to_numpy(dtype=np.float64)
+        y = df_model['Price'].to_numpy(dtype=np.float64)
+        X_train, _, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=42)
+        
+        with self._stage('regional_fit'):
+            self.regional_models = RegionalModelSet.train(
+                X_train, y_train, self.feature_names, directory, self.backend,
+                min_rows, max_workers, fallback=self._predict_global
+            )
+        self._clear_prediction_cache()
+        return compare_with_global(self, df_model, self.regional_models)
+    
+    def train_model_out_of_core(self, filepath='melb_data.csv', work_dir=DEFAULT_MEMMAP_DIR,
+                                chunksize=100000, chunk_rows=500000):
+        """Train the linear model on data larger than RAM
+        
+        Preprocessed chunks are written once to a memory-mapped float32
+        feature matrix in ``work_dir``; the scaler moments and normal
+        equations are then accumulated slice by slice from the memmap. Every
+        fifth row is held out for evaluation instead of a shuffled split.
+        """
+        if self.backend != 'linear' or self.spatial_features:
+            raise ValueError("Out-of-core training supports the plain linear backend only")
+        print("Training model out of core...")
+        
+        self.feature_names = FEATURES + ['PropertyAge', 'RoomToBathroomRatio']
+        with self._stage('feature_memmap'):
+            features = FeatureMemmap.create(
+                work_dir, self.iter_preprocessed_chunks(filepath, chunksize), self.feature_names
+            )
+        
+        with self._stage('fit'):
+            self.sufficient_stats = LinearSufficientStats(len(self.feature_names))
+            for rows, X, y in features.iter_slices(chunk_rows):
+                train = ~holdout_mask(rows)
+                self.sufficient_stats.update(X[train], y[train])
+            self.scaler = None
+            self.model = None
+            self._apply_linear_solution()
+        
+        # Streaming metrics over the held-out rows
+        with self._stage('evaluation'):
+            n = 0
+            sum_y = sum_y2 = sse = sae = 0.0
+            for rows, X, y in features.iter_slices(chunk_rows):
+                test = holdout_mask(rows)
+                y_test = y[test]
+                errors = y_test - self.model.predict(self.scaler.transform(X[test]))
+                n += len(y_test)
+                sum_y += y_test.sum()
+                sum_y2 += (y_test ** 2).sum()
+                sse += (errors ** 2).sum()
+                sae += np.abs(errors).sum()
+            r2 = 1 - sse / (sum_y2 - sum_y ** 2 / n)
+            rmse = np.sqrt(sse / n)
+            mae = sae / n
+        
+        # Reference histograms from an evenly strided sample of the memmap
+        with self._stage('drift_reference'):
+            step = max(1, features.n_rows // 200000)
+            sample = np.asarray(features.X[::step], dtype=np.float64)
+            self.drift_reference = build_reference(
+                sample, self.model.predict(self.scaler.transform(sample)), self.feature_names
+            )
+        
+        print(f"Model Performance ({features.n_rows} rows, {n} held out):")
+        print(f"R² Score: {r2:.4f}")
+        print(f"RMSE: ${rmse:,.2f}")
+        print(f"MAE: ${mae:,.2f}")
+        
+        self.feature_pipeline = FeaturePipeline.from_model(
+            self, NUMERICAL_COLS, CATEGORICAL_COLS, CURRENT_YEAR
+        )
         self.is_trained = True
+        self._clear_prediction_cache()
         return r2, rmse, mae
     
+    def _apply_linear_solution(self):
+        """Set scaler and linear model parameters from the sufficient statistics"""
+        mean, var, scale = self.sufficient_stats.scaler_moments()
+        if self.scaler is None:
+            self.scaler = StandardScaler()
+        self.scaler.mean_ = mean
+        self.scaler.var_ = var
+        self.scaler.scale_ = scale
+        self.scaler.n_samples_seen_ = self.sufficient_stats.n
+        self.scaler.n_features_in_ = len(mean)
+        if self.model is None:
+            self.model = LinearRegression()
+        self.model.coef_, self.model.intercept_ = self.sufficient_stats.solve()
+        self.model.n_features_in_ = len(mean)
+    
     def predict_price(self, house_features):
         """Predict price for a house given its features"""
         if not self.is_trained:
             raise ValueError("Model must be trained first")
         
+        # Serve repeated inputs from the cache
+        if self.prediction_cache is not None:
+            key = self.prediction_cache.key(house_features)
+            cached = self.prediction_cache.get(key)
+            if cached is not None:
+                return cached
+        
         # Convert features to the correct format
         features_array = np.array([house_features])
         
-        # Scale features
-        features_scaled = self.scaler.transform(features_array)
-        
         # Make prediction
-        prediction = self.model.predict(features_scaled)[0]
+        prediction = self._predict_rows(features_array)[0]
+        if self.prediction_cache is not None:
+            self.prediction_cache.put(key, prediction)
         return prediction
     
+    def _predict_rows(self, X):
+        """Score a 2-D feature array, routing by region when regional models are set"""
+        if self.regional_models is not None:
+            return self.regional_models.predict_batch(X)
+        return self._predict_global(X)
+    
+    def _predict_global(self, X):
+        """Score a 2-D feature array with the global model"""
+        if self.quantized_predictor is not None:
+            return self.quantized_predictor.predict_batch(X)
+        return self.model.predict(self.scaler.transform(X))
+    
+    def _clear_prediction_cache(self):
+        """Invalidate cached predictions and rebuild reduced-precision weights after the model changes"""
+        if self.prediction_cache is not None:
+            self.prediction_cache.clear()
+        self.quantized_predictor = (
+            QuantizedLinearPredictor.from_model(self, self.inference_precision,
+                                                self.precision_calibration)
+            if self.inference_precision != 'float64' else None
+        )
+    
+    def set_inference_precision(self, precision='float32', calibration=None):
+        """Switch predict_price/predict_batch to reduced precision (linear models)
+        
+        'float32' halves the bandwidth of batch inputs; 'fixed' quantizes
+        features to int16 with per-feature scales taken from ``calibration``
+        (e.g. the training features). 'float64' restores the sklearn path.
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained first")
+        if precision != 'float64':
+            # Validate before switching, so a bad call leaves the model unchanged
+            QuantizedLinearPredictor.from_model(self, precision, calibration)
+        self.inference_precision = precision
+        self.precision_calibration = calibration
+        self._clear_prediction_cache()
+    
+    def predict_batch(self, data, chunk_size=100000):
+        """Predict prices for many houses with one transform and predict per chunk
+
+        ``data`` may be a DataFrame, a 2-D array or an iterable of such chunks.
+        Throughput of the call is stored in ``self.last_batch_stats``.
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained first")
+        
+        start = time.perf_counter()
+        predictions = []
+        rows = 0
+        chunks = 0
+        float32_input = self.quantized_predictor is not None and self.regional_models is None
+        dtype = np.float32 if float32_input else np.float64
+        for chunk in self._iter_feature_chunks(data, chunk_size, dtype):
+            predictions.append(self._predict_rows(chunk))
+            if self.drift_monitor is not None:
+                self.drift_monitor.update(chunk, predictions[-1])
+            rows += len(chunk)
+            chunks += 1
+        elapsed = time.perf_counter() - start
+        
+        self.last_batch_stats = {
+            'rows': rows,
+            'chunks': chunks,
+            'seconds': elapsed,
+            'rows_per_second': rows / elapsed if elapsed > 0 else float('inf')
+        }
+        
+        if not predictions:
+            return np.empty(0)
+        return np.concatenate(predictions)
+    
+    def enable_drift_monitor(self):
+        """Track every predict_batch call against the training reference histograms
+        
+        Returns the DriftMonitor; call ``report()`` or ``print_report()`` on it
+        to get PSI/KS per feature and for the predictions.
+        """
+        if self.drift_reference is None:
+            raise ValueError("Model has no drift reference; retrain it to enable monitoring")
+        self.drift_monitor = DriftMonitor(self.drift_reference, self.feature_names)
+        return self.drift_monitor
+    
+    def predict_houses(self, houses):
+        """Predict prices for raw houses (dict, list of dicts or DataFrame)
+        
+        Raw values use the dataset's column names and category strings; the
+        feature pipeline imputes, encodes and derives features in one pass.
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained first")
+        return self.predict_batch(self.feature_pipeline.transform(houses))
+
+    def sensitivity_sweep(self, base_house, ranges):
+        """What-if prices for a raw house over a grid of feature values
+
+        ``ranges`` maps raw feature names (e.g. 'Bathroom', 'YearBuilt', or
+        'Type' with category names) to the values to try. The full grid is
+        built as one matrix and scored with a single predict_batch call.
+        Returns a DataFrame with one column per swept feature plus 'Price';
+        with two features, ``table.pivot(index=a, columns=b, values='Price')``
+        gives a heat-map grid.
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained first")
+        raw_cols = self.feature_pipeline.numerical_cols + self.feature_pipeline.categorical_cols
+        unknown = [col for col in ranges if col not in raw_cols]
+        if unknown:
+            raise ValueError(f"Cannot sweep {', '.join(unknown)}. Choose from: {', '.join(raw_cols)}")
+
+        swept = {col: np.asarray(list(values)) for col, values in ranges.items()}
+        # Cartesian product as index arrays, one row per grid point
+        grid = np.meshgrid(*[np.arange(len(values)) for values in swept.values()], indexing='ij')
+        table = pd.DataFrame({col: values[index.ravel()]
+                              for (col, values), index in zip(swept.items(), grid)})
+
+        houses = {col: np.full(len(table), base_house.get(col), dtype=object)
+                  for col in raw_cols if col not in swept}
+        houses.update({col: table[col].to_numpy() for col in swept})
+        table['Price'] = self.predict_batch(self.feature_pipeline.transform(pd.DataFrame(houses)))
+        return table
+
+    def _iter_feature_chunks(self, data, chunk_size, dtype=np.float64):
+        """Yield 2-D float arrays in model feature order"""
+        if isinstance(data, (pd.DataFrame, np.ndarray)):
+            data = [data]
+        
+        for block in data:
+            if isinstance(block, pd.DataFrame):
+                if self.spatial_index is not None and SPATIAL_FEATURES[0] not in block.columns:
+                    block = self.spatial_index.add_features(block)
+                if self.feature_names is not None:
+                    block = block[self.feature_names]
+                block = block.to_numpy(dtype=dtype)
+            else:
+                block = np.asarray(block, dtype=dtype)
+            if block.ndim != 2:
+                raise ValueError("Batch input must be 2-dimensional")
+            
+            for start in range(0, len(block), chunk_size):
+                yield block[start:start + chunk_size]
+    
     def save_model(self, filepath='house_price_model.pkl'):
         """Save the trained model"""
         if not self.is_trained:
@@ -128,10 +632,23 @@ class HousePriceModel:
             'model': self.model,
             'scaler': self.scaler,
             'label_encoders': self.label_encoders,
-            'feature_names': self.feature_names
+            'feature_names': self.feature_names,
+            'backend': self.backend,
+            'feature_pipeline': self.feature_pipeline.to_dict(),
+            'sufficient_stats': (self.sufficient_stats.to_dict()
+                                 if self.sufficient_stats is not None else None),
+            'preprocessing_stats': self.preprocessing_stats,
+            'spatial_index': self.spatial_index,
+            'drift_reference': self.drift_reference,
+            # Relative to the model file, so the pair can be moved or loaded from any cwd
+            'regional_models_dir': (
+                os.path.relpath(os.path.abspath(self.regional_models.directory),
+                                os.path.dirname(os.path.abspath(filepath)))
+                if self.regional_models is not None else None)
         }
         
-        joblib.dump(model_data, filepath)
+        with self._stage('save'):
+            joblib.dump(model_data, filepath)
         print(f"Model saved to {filepath}")
     
     def load_model(self, filepath='house_price_model.pkl'):
@@ -142,22 +659,176 @@ class HousePriceModel:
         self.scaler = model_data['scaler']
         self.label_encoders = model_data['label_encoders']
         self.feature_names = model_data['feature_names']
+        self.backend = model_data.get('backend', 'linear')
+        self.preprocessing_stats = model_data.get('preprocessing_stats')
+        if 'feature_pipeline' in model_data:
+            self.feature_pipeline = FeaturePipeline.from_dict(model_data['feature_pipeline'])
+        else:
+            # Older model files: encoders only, no imputation values
+            self.feature_pipeline = FeaturePipeline.from_model(
+                self, NUMERICAL_COLS, CATEGORICAL_COLS, CURRENT_YEAR
+            )
+        self.spatial_index = model_data.get('spatial_index')
+        self.drift_reference = model_data.get('drift_reference')
+        self.drift_monitor = None
+        self.spatial_features = self.spatial_index is not None
+        self.feature_pipeline.spatial_index = self.spatial_index
+        if model_data.get('sufficient_stats') is not None:
+            self.sufficient_stats = LinearSufficientStats.from_dict(model_data['sufficient_stats'])
+        # Only the index is read here; sub-models load on first use
+        regional_dir = model_data.get('regional_models_dir')
+        self.regional_models = None
+        if regional_dir:
+            regional_dir = os.path.join(os.path.dirname(os.path.abspath(filepath)), regional_dir)
+            if not os.path.exists(os.path.join(regional_dir, 'index.json')):
+                raise FileNotFoundError(
+                    f"Regional sub-models for {filepath} not found in {regional_dir}; "
+                    "restore that directory or retrain with --regional")
+            self.regional_models = RegionalModelSet.load(regional_dir, fallback=self._predict_global)
         self.is_trained = True
+        self._clear_prediction_cache()
         
         print(f"Model loaded from {filepath}")
+    
+    def export_bundle(self, filepath='house_price_model.npz'):
+        """Save a NumPy-only bundle that loads without sklearn (see fast_predictor)"""
+        save_bundle(self, filepath)
+
+def default_csv_engine():
+    """Use the multithreaded pyarrow parser when it is installed"""
+    try:
+        import pyarrow  # noqa: F401
+        return 'pyarrow'
+    except ImportError:
+        return 'c'
+
+def read_housing_csv(filepath='melb_data.csv', engine=None, chunksize=None):
+    """Read only the model columns of the dataset with compact dtypes
+    
+    Pass ``chunksize`` to get an iterator of chunks (C parser only).
+    """
+    if engine is None:
+        engine = 'c' if chunksize else default_csv_engine()
+    return pd.read_csv(filepath, usecols=FEATURES + ['Price'], dtype=CSV_DTYPES,
+                       engine=engine, chunksize=chunksize)
+
+def compare_csv_loaders(filepath='melb_data.csv', engine=None):
+    """Report load time and memory of a full read_csv against read_housing_csv"""
+    start = time.perf_counter()
+    df_full = pd.read_csv(filepath)
+    full_seconds = time.perf_counter() - start
+    full_bytes = df_full.memory_usage(deep=True).sum()
+    
+    start = time.perf_counter()
+    df_pruned = read_housing_csv(filepath, engine=engine)
+    pruned_seconds = time.perf_counter() - start
+    pruned_bytes = df_pruned.memory_usage(deep=True).sum()
+    
+    results = {
+        'engine': engine or default_csv_engine(),
+        'full_seconds': full_seconds,
+        'full_bytes': int(full_bytes),
+        'pruned_seconds': pruned_seconds,
+        'pruned_bytes': int(pruned_bytes),
+        'time_speedup': full_seconds / pruned_seconds if pruned_seconds > 0 else float('inf'),
+        'memory_reduction': 1 - pruned_bytes / full_bytes
+    }
+    
+    print("CSV Loader Comparison:")
+    print(f"Full read:   {full_seconds * 1000:,.1f} ms, {full_bytes / 1e6:,.2f} MB")
+    print(f"Pruned read: {pruned_seconds * 1000:,.1f} ms, {pruned_bytes / 1e6:,.2f} MB "
+          f"({results['engine']} engine)")
+    print(f"Speedup: {results['time_speedup']:,.1f}x, memory saved: {results['memory_reduction']:.1%}")
+    return results
+
+def benchmark_prediction_paths(model, X, n_single=1000, chunk_size=100000):
+    """Compare per-row predict_price throughput against predict_batch"""
+    if isinstance(X, pd.DataFrame):
+        X = X[model.feature_names].to_numpy(dtype=np.float64)
+    X = np.asarray(X, dtype=np.float64)
+    
+    # Per-row path on a sample, since it is far too slow for the full set;
+    # the prediction cache is bypassed so every call does the full work
+    sample = X[:n_single]
+    cache, model.prediction_cache = model.prediction_cache, None
+    try:
+        start = time.perf_counter()
+        for row in sample:
+            model.predict_price(row)
+        single_elapsed = time.perf_counter() - start
+    finally:
+        model.prediction_cache = cache
+    single_rate = len(sample) / single_elapsed if single_elapsed > 0 else float('inf')
+    
+    model.predict_batch(X, chunk_size=chunk_size)
+    batch_rate = model.last_batch_stats['rows_per_second']
+    
+    results = {
+        'single_rows': len(sample),
+        'single_rows_per_second': single_rate,
+        'batch_rows': len(X),
+        'batch_rows_per_second': batch_rate,
+        'speedup': batch_rate / single_rate if single_rate > 0 else float('inf')
+    }
+    
+    print("Prediction Throughput:")
+    print(f"Per-row: {single_rate:,.0f} rows/s ({len(sample)} rows)")
+    print(f"Batch:   {batch_rate:,.0f} rows/s ({len(X)} rows)")
+    print(f"Speedup: {results['speedup']:,.1f}x")
+    return results
 
-def train_and_save_model():
-    """Train the model and save it for use in GUI"""
+def update_and_save_model(new_data_path, model_path='house_price_model.pkl'):
+    """Fold a CSV of new sales into the saved model and save it again"""
     model = HousePriceModel()
+    model.load_model(model_path)
+    model.update_model(new_data_path)
+    model.save_model(model_path)
+    if model.backend == 'linear' and model.spatial_index is None and model.regional_models is None:
+        model.export_bundle(os.path.splitext(model_path)[0] + '.npz')
+    return model
+
+def train_and_save_model(cache_dir=DEFAULT_CACHE_DIR, backend='linear', spatial_features=False,
+                         profile_dir=None, cprofile=False, snapshots=False,
+                         out_of_core=False, filepath='melb_data.csv', regional=False):
+    """Train the model and save it for use in GUI
     
-    # Load and preprocess data
-    df_model = model.load_and_preprocess_data()
+    With ``profile_dir`` set, per-stage timings and memory are written to
+    ``profile_dir/profile_report.json`` (plus cProfile/tracemalloc dumps if
+    requested); profiled runs skip the cache read so every preprocessing
+    stage is measured. ``cache_dir=None`` disables the cache. ``regional``
+    also trains per-region sub-models.
+    """
+    if regional and out_of_core:
+        raise ValueError("Regional models need the in-memory training frame")
+    profiler = PipelineProfiler(profile_dir, cprofile, snapshots) if profile_dir else None
+    model = HousePriceModel(backend=backend, spatial_features=spatial_features,
+                            profiler=profiler)
     
-    # Train model
-    r2, rmse, mae = model.train_model(df_model)
+    if out_of_core:
+        # Stream the CSV into a memory-mapped feature matrix and train from it
+        r2, rmse, mae = model.train_model_out_of_core(filepath)
+    else:
+        # Load and preprocess data (reuses the preprocessed cache when valid)
+        df_model = model.load_and_preprocess_data(filepath, cache_dir=cache_dir,
+                                                  refresh_cache=profile_dir is not None)
+        
+        # Train model
+        r2, rmse, mae = model.train_model(df_model)
+        
+        if regional:
+            model.train_regional_models(df_model)
     
-    # Save model
+    # Save model, plus the fast-loading bundle for plain linear models
+    # (the bundle holds only the global model, so not with regional routing)
     model.save_model()
+    if backend == 'linear' and not spatial_features and not regional:
+        model.export_bundle()
+    
+    if profiler:
+        profiler.print_summary()
+        profiler.save_report()
+        profiler.stop()
+        model.profiler = None
     
     print("\nModel training completed successfully!")
     print("You can now use the GUI to make predictions.")
@@ -165,8 +836,36 @@ def train_and_save_model():
     return model
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Train or update the house price model")
+    parser.add_argument('--update', metavar='CSV',
+                        help="fold new sales into the saved model instead of retraining")
+    parser.add_argument('--spatial', action='store_true',
+                        help="add nearest-neighbour price features")
+    parser.add_argument('--data', default='melb_data.csv', help="training CSV")
+    parser.add_argument('--out-of-core', action='store_true',
+                        help="train from a memory-mapped feature matrix (linear only)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="preprocess from the CSV without the preprocessed-frame cache")
+    parser.add_argument('--regional', action='store_true',
+                        help="also train one sub-model per region, in parallel")
+    parser.add_argument('--profile', metavar='DIR',
+                        help="write a per-stage timing/memory report to DIR")
+    parser.add_argument('--cprofile', action='store_true',
+                        help="with --profile, also dump cProfile stats per stage")
+    parser.add_argument('--snapshots', action='store_true',
+                        help="with --profile, also dump tracemalloc snapshots per stage")
+    args = parser.parse_args()
+    
     print("="*50)
     print("HOUSE PRICE PREDICTION MODEL TRAINING")
     print("="*50)
     
-    model = train_and_save_model()
+    if args.update:
+        model = update_and_save_model(args.update)
+    else:
+        model = train_and_save_model(spatial_features=args.spatial, profile_dir=args.profile,
+                                     cprofile=args.cprofile, snapshots=args.snapshots,
+                                     out_of_core=args.out_of_core, filepath=args.data,
+                                     regional=args.regional,
+                                     cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR)
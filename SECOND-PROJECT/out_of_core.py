@@ -0,0 +1,58 @@
+"""
+Out-of-Core Training
+Memory-mapped float32 feature matrix on disk, read back in slices for chunked training
+"""
+
+import json
+import os
+import numpy as np
+
+
+class FeatureMemmap:
+    """Engineered features (float32) and target (float64) stored as raw files
+
+    ``X.f32`` is a row-major float32 matrix and ``y.f64`` the matching target;
+    ``meta.json`` records the shape and feature names. Both files are opened
+    with np.memmap, so slicing reads from disk without loading the whole
+    matrix into RAM.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, 'meta.json')) as f:
+            meta = json.load(f)
+        self.n_rows = meta['n_rows']
+        self.feature_names = meta['feature_names']
+        shape = (self.n_rows, len(self.feature_names))
+        self.X = np.memmap(os.path.join(directory, 'X.f32'), dtype=np.float32,
+                           mode='r', shape=shape) if self.n_rows else np.empty((0, shape[1]), np.float32)
+        self.y = np.memmap(os.path.join(directory, 'y.f64'), dtype=np.float64,
+                           mode='r', shape=(self.n_rows,)) if self.n_rows else np.empty(0)
+
+    @classmethod
+    def create(cls, directory, chunks, feature_names, target='Price'):
+        """Write preprocessed DataFrame chunks to disk once, appending row blocks"""
+        os.makedirs(directory, exist_ok=True)
+        n_rows = 0
+        with open(os.path.join(directory, 'X.f32'), 'wb') as fx, \
+                open(os.path.join(directory, 'y.f64'), 'wb') as fy:
+            for chunk in chunks:
+                fx.write(np.ascontiguousarray(chunk[feature_names].to_numpy(dtype=np.float32)).tobytes())
+                fy.write(np.ascontiguousarray(chunk[target].to_numpy(dtype=np.float64)).tobytes())
+                n_rows += len(chunk)
+        with open(os.path.join(directory, 'meta.json'), 'w') as f:
+            json.dump({'n_rows': n_rows, 'feature_names': list(feature_names)}, f)
+        return cls(directory)
+
+    def iter_slices(self, chunk_rows=500000):
+        """Yield (row_indices, X_slice as float64, y_slice) blocks"""
+        for start in range(0, self.n_rows, chunk_rows):
+            stop = min(start + chunk_rows, self.n_rows)
+            yield (np.arange(start, stop),
+                   np.asarray(self.X[start:stop], dtype=np.float64),
+                   np.asarray(self.y[start:stop]))
+
+
+def holdout_mask(row_indices, test_every=5):
+    """Deterministic 1-in-``test_every`` hold-out split that needs no shuffle"""
+    return row_indices % test_every == 0
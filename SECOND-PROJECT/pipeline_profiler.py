@@ -0,0 +1,124 @@
+"""
+Pipeline Profiler
+Opt-in per-stage wall time, CPU time and peak memory for the training pipeline
+"""
+
+import cProfile
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _max_rss_mb():
+    """Peak resident set size of the process so far, in MB (None if unavailable)"""
+    if resource is None:
+        return None
+    # ru_maxrss is KB on Linux, bytes on macOS
+    scale = 1 / (1024 * 1024) if sys.platform == 'darwin' else 1 / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+class PipelineProfiler:
+    """Record timings and memory for named pipeline stages
+
+    Use ``with profiler.stage('fit'):`` around each step. A stage entered more
+    than once (e.g. per chunk) accumulates. Peak memory comes from tracemalloc,
+    which is started by the profiler. With ``output_dir`` set, ``cprofile``
+    dumps a ``.prof`` file per stage and ``snapshots`` dumps a tracemalloc
+    snapshot at the end of each stage.
+
+    Stages may nest (the out-of-core memmap stage drives the preprocessing
+    stages). An inner stage's time is also counted in the outer one, and only
+    the outermost stage runs cProfile, since one profiler can be active at a
+    time; its ``.prof`` covers the inner stages.
+    """
+
+    def __init__(self, output_dir=None, cprofile=False, snapshots=False):
+        self.output_dir = output_dir
+        self.cprofile = cprofile
+        self.snapshots = snapshots
+        self.stages = {}
+        # Peak traced memory seen so far by each open stage, outermost first
+        self._open_peaks = []
+        self.started = time.perf_counter()
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name):
+        """Measure one pipeline stage"""
+        # Save the enclosing stage's peak before resetting it for this one
+        if self._open_peaks:
+            self._open_peaks[-1] = max(self._open_peaks[-1], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+        self._open_peaks.append(start_memory)
+        profiler = cProfile.Profile() if self.cprofile and len(self._open_peaks) == 1 else None
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        if profiler:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler:
+                profiler.disable()
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            absolute_peak = max(self._open_peaks.pop(), tracemalloc.get_traced_memory()[1])
+            if self._open_peaks:
+                self._open_peaks[-1] = max(self._open_peaks[-1], absolute_peak)
+            peak = absolute_peak - start_memory
+
+            record = self.stages.setdefault(name, {
+                'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'peak_memory_mb': 0.0
+            })
+            record['calls'] += 1
+            record['wall_seconds'] += wall
+            record['cpu_seconds'] += cpu
+            record['peak_memory_mb'] = max(record['peak_memory_mb'], peak / 1e6)
+
+            if profiler and self.output_dir:
+                profiler.dump_stats(os.path.join(self.output_dir, f'{name}.prof'))
+            if self.snapshots and self.output_dir:
+                tracemalloc.take_snapshot().dump(
+                    os.path.join(self.output_dir, f'{name}.tracemalloc'))
+
+    def report(self):
+        """Stage records plus totals, as a JSON-friendly dict"""
+        return {
+            'stages': self.stages,
+            'total_wall_seconds': time.perf_counter() - self.started,
+            'process_max_rss_mb': _max_rss_mb()
+        }
+
+    def save_report(self, filepath=None):
+        """Write the report as JSON (default: profile_report.json in output_dir)"""
+        if filepath is None:
+            filepath = os.path.join(self.output_dir or '.', 'profile_report.json')
+        with open(filepath, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+        print(f"Profile report saved to {filepath}")
+        return filepath
+
+    def print_summary(self):
+        print("Pipeline Profile:")
+        print(f"{'stage':<20}{'calls':>6}{'wall s':>10}{'cpu s':>10}{'peak MB':>10}")
+        for name, r in self.stages.items():
+            print(f"{name:<20}{r['calls']:>6}{r['wall_seconds']:>10.3f}"
+                  f"{r['cpu_seconds']:>10.3f}{r['peak_memory_mb']:>10.1f}")
+
+    def stop(self):
+        """Stop tracemalloc tracing"""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
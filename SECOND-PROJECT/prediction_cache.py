@@ -0,0 +1,69 @@
+"""
+Prediction Cache
+Bounded LRU/TTL cache of single-house predictions keyed on the normalized feature vector
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class PredictionCache:
+    """LRU cache with optional time-to-live and hit/miss statistics
+
+    Feature values are rounded to ``decimals`` places before being used as the
+    key, so inputs that differ only by float noise share an entry.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None, decimals=6):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.decimals = decimals
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, features):
+        """Normalized, hashable form of a feature vector"""
+        return tuple(round(float(value), self.decimals) for value in features)
+
+    def get(self, key):
+        """Return the cached prediction, or None on a miss or expired entry"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                value, stored = entry
+                if self.ttl is None or time.monotonic() - stored <= self.ttl:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic())
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries (called whenever the model changes); keeps the counters"""
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
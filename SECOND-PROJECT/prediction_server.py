@@ -0,0 +1,216 @@
+"""
+Prediction Server
+Local HTTP/JSON API around HousePriceModel with micro-batching of single-row requests
+"""
+
+import argparse
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+import numpy as np
+from flask import Flask, request, jsonify
+
+from model_training import HousePriceModel
+
+app = Flask(__name__)
+
+# Set by load_server_model() before the server starts
+model = None
+batcher = None
+
+
+class ServerStats:
+    """Thread-safe request, row and latency counters"""
+
+    def __init__(self, latency_window=10000):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.batched_rows = 0
+        self.errors = 0
+        self.latencies_ms = deque(maxlen=latency_window)
+
+    def record_request(self, rows, seconds):
+        with self.lock:
+            self.requests += 1
+            self.rows += rows
+            self.latencies_ms.append(seconds * 1000)
+
+    def record_batch(self, rows):
+        with self.lock:
+            self.batches += 1
+            self.batched_rows += rows
+
+    def record_error(self):
+        with self.lock:
+            self.errors += 1
+
+    def snapshot(self):
+        with self.lock:
+            uptime = time.time() - self.started
+            latencies = np.array(self.latencies_ms) if self.latencies_ms else np.zeros(1)
+            return {
+                'uptime_seconds': uptime,
+                'requests': self.requests,
+                'rows': self.rows,
+                'errors': self.errors,
+                'micro_batches': self.batches,
+                'mean_micro_batch_size': self.batched_rows / self.batches if self.batches else 0.0,
+                'requests_per_second': self.requests / uptime if uptime > 0 else 0.0,
+                'rows_per_second': self.rows / uptime if uptime > 0 else 0.0,
+                'latency_p50_ms': float(np.percentile(latencies, 50)),
+                'latency_p99_ms': float(np.percentile(latencies, 99))
+            }
+
+
+stats = ServerStats()
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-row predictions into one predict_batch call
+
+    A background thread waits for the first queued row, then keeps collecting
+    until ``max_batch_size`` rows are queued or ``max_wait_ms`` has passed.
+    """
+
+    def __init__(self, model, max_batch_size=256, max_wait_ms=2.0):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.pending = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, features):
+        """Queue one feature row; returns a Future resolving to the price"""
+        future = Future()
+        self.pending.put((features, future))
+        return future
+
+    def _run(self):
+        while True:
+            items = [self.pending.get()]
+            deadline = time.perf_counter() + self.max_wait
+            while len(items) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self.pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                prices = self.model.predict_batch(np.array([f for f, _ in items]))
+                stats.record_batch(len(items))
+                for (_, future), price in zip(items, prices):
+                    future.set_result(float(price))
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+
+
+def parse_row(row):
+    """Accept a list in model feature order or a raw house dict"""
+    if isinstance(row, dict):
+        return model.feature_pipeline.transform_one(row).tolist()
+    if len(row) != len(model.feature_names):
+        raise ValueError(f"Expected {len(model.feature_names)} features, got {len(row)}")
+    return [float(value) for value in row]
+
+
+def json_payload():
+    """The request's JSON object; missing or non-JSON bodies are a client error (400)"""
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        raise ValueError("Request body must be a JSON object")
+    return payload
+
+
+def load_server_model(model_path='house_price_model.pkl', max_batch_size=256, max_wait_ms=2.0):
+    """Load the saved model once and start the micro-batcher"""
+    global model, batcher
+    model = HousePriceModel()
+    model.load_model(model_path)
+    if model.drift_reference is not None:
+        model.enable_drift_monitor()
+    batcher = MicroBatcher(model, max_batch_size, max_wait_ms)
+
+
+@app.route('/health', methods=['GET'])
+def health():
+    """Report whether the model is loaded"""
+    return jsonify({'status': 'online', 'model_loaded': model is not None})
+
+
+@app.route('/predict', methods=['POST'])
+def predict():
+    """Predict one house: {"features": [...]} or {"features": {raw house}}"""
+    start = time.perf_counter()
+    try:
+        features = parse_row(json_payload()['features'])
+        price = batcher.submit(features).result(timeout=30)
+    except (KeyError, TypeError, ValueError) as e:
+        stats.record_error()
+        return jsonify({'success': False, 'error': f"Invalid request: {e}"}), 400
+    except Exception as e:
+        stats.record_error()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+    stats.record_request(1, time.perf_counter() - start)
+    return jsonify({'success': True, 'price': price})
+
+
+@app.route('/predict/batch', methods=['POST'])
+def predict_batch():
+    """Predict many houses in one call: {"rows": [[...], ...]} or {"houses": [{...}, ...]}"""
+    start = time.perf_counter()
+    try:
+        payload = json_payload()
+        if 'houses' in payload:
+            rows = model.feature_pipeline.transform(payload['houses'])
+        else:
+            rows = np.array([parse_row(row) for row in payload['rows']])
+        prices = model.predict_batch(rows) if len(rows) else np.empty(0)
+    except (KeyError, TypeError, ValueError) as e:
+        stats.record_error()
+        return jsonify({'success': False, 'error': f"Invalid request: {e}"}), 400
+    except Exception as e:
+        stats.record_error()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+    stats.record_request(len(rows), time.perf_counter() - start)
+    return jsonify({'success': True, 'prices': prices.tolist()})
+
+
+@app.route('/stats', methods=['GET'])
+def get_stats():
+    """Latency and throughput counters"""
+    return jsonify(stats.snapshot())
+
+
+@app.route('/drift', methods=['GET'])
+def get_drift():
+    """PSI/KS of scored inputs and predictions against the training reference"""
+    if model.drift_monitor is None:
+        return jsonify({'success': False,
+                        'error': "Model has no drift reference; retrain it"}), 404
+    return jsonify(model.drift_monitor.report())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="House price prediction server")
+    parser.add_argument('--model', default='house_price_model.pkl')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5001)
+    parser.add_argument('--max-batch-size', type=int, default=256)
+    parser.add_argument('--max-wait-ms', type=float, default=2.0)
+    args = parser.parse_args()
+
+    load_server_model(args.model, args.max_batch_size, args.max_wait_ms)
+    print(f"Prediction server running on http://{args.host}:{args.port}")
+    app.run(host=args.host, port=args.port, threaded=True)
@@ -0,0 +1,95 @@
+"""
+Preprocessing Cache
+On-disk cache of the preprocessed training frame, keyed by source file and parameters
+"""
+
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Bump when the layout of cached files changes
+CACHE_VERSION = 1
+
+
+def file_digest(filepath, block_size=1 << 20):
+    """SHA-256 of a file's contents, read in blocks"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _has_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class PreprocessingCache:
+    """Columnar binary cache for preprocessed DataFrames
+
+    Frames are stored as uncompressed Feather when pyarrow is installed and as
+    one ``.npy`` file per column otherwise; both are read memory-mapped. A JSON
+    sidecar holds the metadata needed to restore the fitted preprocessing state.
+    """
+
+    def __init__(self, cache_dir='.preprocess_cache'):
+        self.cache_dir = cache_dir
+
+    def key(self, filepath, params):
+        """Cache key from the source file contents and preprocessing parameters"""
+        payload = json.dumps({'file': file_digest(filepath), 'params': params,
+                              'version': CACHE_VERSION}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def load(self, key):
+        """Return (DataFrame, metadata) for a key, or None on a miss"""
+        meta_path = self._path(key, '.json')
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path) as f:
+            meta = json.load(f)
+
+        if meta['format'] == 'feather':
+            import pyarrow.feather as feather
+            table = feather.read_table(self._path(key, '.feather'), memory_map=True)
+            df = table.to_pandas()
+        else:
+            data_dir = self._path(key, '')
+            df = pd.DataFrame({
+                col: np.load(os.path.join(data_dir, f'{i}.npy'), mmap_mode='r')
+                for i, col in enumerate(meta['columns'])
+            }, copy=False)
+            df.index = np.load(os.path.join(data_dir, 'index.npy'))
+        df.columns = meta['columns']
+        return df, meta['metadata']
+
+    def save(self, key, df, metadata):
+        """Write a DataFrame and its metadata under a key"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fmt = 'feather' if _has_pyarrow() else 'npy'
+
+        if fmt == 'feather':
+            import pyarrow as pa
+            import pyarrow.feather as feather
+            table = pa.Table.from_pandas(df, preserve_index=True)
+            feather.write_feather(table, self._path(key, '.feather'), compression='uncompressed')
+        else:
+            data_dir = self._path(key, '')
+            os.makedirs(data_dir, exist_ok=True)
+            for i, col in enumerate(df.columns):
+                np.save(os.path.join(data_dir, f'{i}.npy'), df[col].to_numpy())
+            np.save(os.path.join(data_dir, 'index.npy'), df.index.to_numpy())
+
+        # Metadata last, so a partially written entry is never read as a hit
+        with open(self._path(key, '.json'), 'w') as f:
+            json.dump({'format': fmt, 'columns': list(df.columns),
+                       'metadata': metadata}, f, default=str)
+
+    def _path(self, key, suffix):
+        return os.path.join(self.cache_dir, key + suffix)
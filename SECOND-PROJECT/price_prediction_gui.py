@@ -1,31 +1,99 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import numpy as np
-from model_training import HousePriceModel
 import os
+import queue
 import threading
 
+# Features offered for what-if sweeps and the (low, high, steps) range tried
+SWEEP_FEATURES = {
+    'Rooms': (1, 8, 8),
+    'Bathroom': (1, 5, 5),
+    'Car': (0, 5, 6),
+    'Distance': (0, 40, 41),
+    'Landsize': (0, 2000, 41),
+    'BuildingArea': (50, 500, 46),
+    'YearBuilt': (1900, 2017, 118)
+}
+
+
+def sweep_values(feature, current):
+    """Values to sweep for a feature, always including the current value"""
+    low, high, steps = SWEEP_FEATURES[feature]
+    return np.unique(np.append(np.linspace(low, high, steps), current))
+
+
 class HousePricePredictionGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("House Price Prediction System")
-        self.root.geometry("600x700")
+        self.root.geometry("600x760")
         self.root.configure(bg='#f0f0f0')
         
-        # Initialize model
-        self.model = HousePriceModel()
-        self.load_or_train_model()
+        # The model (and sklearn) is imported, loaded or trained on a worker thread
+        self.model = None
+        self.model_loaded = False
+        self.status_queue = queue.Queue()
         
         # Create GUI elements
         self.create_widgets()
+        self.start_model_loading()
         
+    def start_model_loading(self):
+        """Load or train the model in the background so the window appears immediately"""
+        self.progress.start(10)
+        worker = threading.Thread(target=self.load_or_train_model, daemon=True)
+        worker.start()
+        self.root.after(100, self.poll_model_status)
+    
+    def poll_model_status(self):
+        """Apply status messages from the worker thread on the Tk thread"""
+        while True:
+            try:
+                kind, message = self.status_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == 'status':
+                self.status_var.set(f"Status: {message}")
+            elif kind == 'ready':
+                self.model_loaded = True
+                self.progress.stop()
+                self.progress.pack_forget()
+                self.predict_btn.config(state='normal')
+                self.sweep_btn.config(state='normal')
+                self.status_var.set("Status: Model Ready")
+                return
+            elif kind == 'error':
+                self.progress.stop()
+                self.progress.pack_forget()
+                self.status_var.set("Status: Model Not Loaded")
+                messagebox.showerror("Error", f"Error training model: {message}")
+                return
+        
+        self.root.after(100, self.poll_model_status)
+    
+    def report_status(self, message):
+        """Queue a status message for the Tk thread (safe to call from the worker)"""
+        print(message)
+        self.status_queue.put(('status', message))
+    
     def load_or_train_model(self):
         """Load the trained model or train it if not found"""
+        self.report_status("Importing model libraries...")
+        try:
+            from model_training import HousePriceModel
+        except ImportError as e:
+            self.status_queue.put(('error', str(e)))
+            return
+        self.model = HousePriceModel()
+        
         try:
             if os.path.exists('house_price_model.pkl'):
+                self.report_status("Loading model...")
                 self.model.load_model()
-                self.model_loaded = True
                 print("Model loaded successfully!")
+                self.status_queue.put(('ready', None))
             else:
                 print("Model not found. Training new model...")
                 self.train_model_automatically()
@@ -35,20 +103,22 @@ class HousePricePredictionGUI:
     
     def train_model_automatically(self):
         """Train the model automatically if not found"""
+        from model_training import DEFAULT_CACHE_DIR
         try:
-            print("Training model, please wait...")
+            self.report_status("Preprocessing data (first run only)...")
             # Load and preprocess data
-            df_model = self.model.load_and_preprocess_data()
+            df_model = self.model.load_and_preprocess_data(cache_dir=DEFAULT_CACHE_DIR)
             # Train model
+            self.report_status("Training model, please wait...")
             self.model.train_model(df_model)
             # Save model
+            self.report_status("Saving model...")
             self.model.save_model()
-            self.model_loaded = True
             print("Model training completed successfully!")
+            self.status_queue.put(('ready', None))
         except Exception as e:
-            self.model_loaded = False
             print(f"Error training model: {e}")
-            messagebox.showerror("Error", f"Error training model: {str(e)}")
+            self.status_queue.put(('error', str(e)))
     
     def create_widgets(self):
         """Create all GUI widgets"""
@@ -73,11 +143,12 @@ class HousePricePredictionGUI:
         button_frame = tk.Frame(main_frame, bg='#f0f0f0')
         button_frame.pack(fill='x', pady=20)
         
-        # Predict button
-        predict_btn = tk.Button(button_frame, text="🔮 Predict Price", 
-                               command=self.predict_price, font=("Arial", 12, "bold"),
-                               bg='#3498db', fg='white', padx=20, pady=10)
-        predict_btn.pack(side='left', padx=10)
+        # Predict button (enabled once the model is ready)
+        self.predict_btn = tk.Button(button_frame, text="🔮 Predict Price", 
+                                     command=self.predict_price, font=("Arial", 12, "bold"),
+                                     bg='#3498db', fg='white', padx=20, pady=10,
+                                     state='disabled')
+        self.predict_btn.pack(side='left', padx=10)
         
         # Clear button
         clear_btn = tk.Button(button_frame, text="🗑️ Clear All", 
@@ -91,6 +162,20 @@ class HousePricePredictionGUI:
                               bg='#f39c12', fg='white', padx=20, pady=10)
         sample_btn.pack(side='left', padx=10)
         
+        # What-if sweep: one feature over a range, scored in one batched call
+        sweep_frame = tk.Frame(main_frame, bg='#f0f0f0')
+        sweep_frame.pack(fill='x')
+        tk.Label(sweep_frame, text="What if I change:", font=("Arial", 10),
+                 bg='#f0f0f0').pack(side='left', padx=5)
+        self.sweep_feature = ttk.Combobox(sweep_frame, values=list(SWEEP_FEATURES),
+                                          state='readonly', width=15)
+        self.sweep_feature.set('Bathroom')
+        self.sweep_feature.pack(side='left', padx=5)
+        self.sweep_btn = tk.Button(sweep_frame, text="📈 Sensitivity",
+                                   command=self.show_sensitivity, font=("Arial", 10, "bold"),
+                                   bg='#8e44ad', fg='white', padx=10, state='disabled')
+        self.sweep_btn.pack(side='left', padx=5)
+        
         # Result frame
         result_frame = tk.LabelFrame(main_frame, text="Prediction Result", 
                                     font=("Arial", 12, "bold"), bg='#f0f0f0', fg='#2c3e50')
@@ -107,12 +192,15 @@ class HousePricePredictionGUI:
         
         # Status bar
         self.status_var = tk.StringVar()
-        status_text = "Model Ready" if self.model_loaded else "Model Not Loaded"
-        self.status_var.set(f"Status: {status_text}")
+        self.status_var.set("Status: Loading model...")
         
         status_bar = tk.Label(self.root, textvariable=self.status_var, 
                              relief='sunken', anchor='w', font=("Arial", 10))
         status_bar.pack(side='bottom', fill='x')
+        
+        # Progress indicator shown while the model loads
+        self.progress = ttk.Progressbar(self.root, mode='indeterminate')
+        self.progress.pack(side='bottom', fill='x', padx=20, pady=5)
     
     def create_input_fields(self, parent):
         """Create input fields for house features"""
@@ -174,71 +262,89 @@ class HousePricePredictionGUI:
             
             # Display result
             self.result_var.set(f"🏠 Predicted House Price: ${predicted_price:,.2f}")
-            self.status_var.set("Status: Prediction completed successfully")
+            cache_stats = self.model.prediction_cache.stats()
+            self.status_var.set(f"Status: Prediction completed successfully "
+                                f"(cache hit rate {cache_stats['hit_rate']:.0%})")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error making prediction: {str(e)}")
             self.status_var.set("Status: Error occurred")
     
-    def get_input_features(self):
-        """Extract and validate input features"""
-        features = []
+    def show_sensitivity(self):
+        """Plot the predicted price over a range of one feature's values"""
+        if not self.model_loaded:
+            messagebox.showerror("Error", "Model not loaded. Please train the model first.")
+            return
+        
+        try:
+            house = self.get_raw_house()
+            feature = self.sweep_feature.get()
+            values = sweep_values(feature, house[feature])
+            table = self.model.sensitivity_sweep(house, {feature: values})
+        except Exception as e:
+            messagebox.showerror("Error", f"Error running sensitivity sweep: {str(e)}")
+            return
         
-        # Feature order must match the model's expected input
-        feature_order = [
+        self.plot_sweep(feature, table[feature].to_numpy(), table['Price'].to_numpy(),
+                        house[feature])
+        self.status_var.set(f"Status: Swept {feature} over {len(table)} values in one batch")
+    
+    def plot_sweep(self, feature, xs, prices, current):
+        """Draw a price curve on a plain Tk canvas"""
+        width, height, margin = 520, 320, 60
+        window = tk.Toplevel(self.root)
+        window.title(f"Price vs {feature}")
+        canvas = tk.Canvas(window, width=width, height=height, bg='white')
+        canvas.pack(padx=10, pady=10)
+        
+        x_low, x_high = float(xs.min()), float(xs.max())
+        y_low, y_high = float(prices.min()), float(prices.max())
+        x_span = (x_high - x_low) or 1.0
+        y_span = (y_high - y_low) or 1.0
+        
+        def to_canvas(x, y):
+            return (margin + (x - x_low) / x_span * (width - 2 * margin),
+                    height - margin - (y - y_low) / y_span * (height - 2 * margin))
+        
+        canvas.create_line(margin, height - margin, width - margin, height - margin)
+        canvas.create_line(margin, margin, margin, height - margin)
+        points = [coord for x, y in zip(xs, prices) for coord in to_canvas(x, y)]
+        if len(points) >= 4:
+            canvas.create_line(*points, fill='#3498db', width=2)
+        cx, _ = to_canvas(current, y_low)
+        canvas.create_line(cx, margin, cx, height - margin, fill='#e74c3c', dash=(4, 2))
+        
+        canvas.create_text(width / 2, height - 20, text=feature, font=("Arial", 10))
+        canvas.create_text(margin, height - margin + 12, text=f"{x_low:g}", font=("Arial", 8))
+        canvas.create_text(width - margin, height - margin + 12, text=f"{x_high:g}",
+                           font=("Arial", 8))
+        canvas.create_text(margin - 5, height - margin, text=f"${y_low / 1e6:.2f}M",
+                           anchor='e', font=("Arial", 8))
+        canvas.create_text(margin - 5, margin, text=f"${y_high / 1e6:.2f}M",
+                           anchor='e', font=("Arial", 8))
+    
+    def get_raw_house(self):
+        """Read the form as a raw house dict (dataset column names)"""
+        numerical_keys = [
             'Rooms', 'Distance', 'Bathroom', 'Car', 'Landsize', 
-            'BuildingArea', 'YearBuilt', 'Lattitude', 'Longtitude', 
-            'Propertycount', 'Type', 'Regionname', 'PropertyAge', 'RoomToBathroomRatio'
+            'BuildingArea', 'YearBuilt', 'Lattitude', 'Longtitude', 'Propertycount'
         ]
         
         # Get numerical features
         try:
-            rooms = float(self.entries['Rooms'].get())
-            distance = float(self.entries['Distance'].get())
-            bathroom = float(self.entries['Bathroom'].get())
-            car = float(self.entries['Car'].get())
-            landsize = float(self.entries['Landsize'].get())
-            building_area = float(self.entries['BuildingArea'].get())
-            year_built = float(self.entries['YearBuilt'].get())
-            lattitude = float(self.entries['Lattitude'].get())
-            longtitude = float(self.entries['Longtitude'].get())
-            property_count = float(self.entries['Propertycount'].get())
-            
-            # Encode categorical features
-            property_type = self.entries['Type'].get().lower()
-            region = self.entries['Regionname'].get()
-            
-            # Simple encoding for property type
-            type_encoding = {'house': 1, 'unit': 0, 'townhouse': 2}
-            encoded_type = type_encoding.get(property_type, 1)
-            
-            # Simple encoding for region (simplified)
-            region_encoding = {
-                'northern metropolitan': 0,
-                'southern metropolitan': 1,
-                'eastern metropolitan': 2,
-                'western metropolitan': 3,
-                'south-eastern metropolitan': 4
-            }
-            encoded_region = region_encoding.get(region.lower(), 0)
-            
-            # Calculate derived features
-            current_year = 2017
-            property_age = current_year - year_built
-            room_to_bathroom_ratio = rooms / (bathroom + 1)
-            
-            # Create features array in the correct order
-            features = [
-                rooms, distance, bathroom, car, landsize,
-                building_area, year_built, lattitude, longtitude,
-                property_count, encoded_type, encoded_region,
-                property_age, room_to_bathroom_ratio
-            ]
-            
-            return features
-            
-        except ValueError as e:
+            house = {key: float(self.entries[key].get()) for key in numerical_keys}
+        except ValueError:
             raise ValueError("Please enter valid numerical values for all fields")
+        
+        house['Type'] = self.entries['Type'].get()
+        house['Regionname'] = self.entries['Regionname'].get()
+        return house
+    
+    def get_input_features(self):
+        """Extract and validate input features"""
+        # Categorical values are encoded by the model's saved feature pipeline,
+        # which also computes PropertyAge and RoomToBathroomRatio
+        return self.model.feature_pipeline.transform_one(self.get_raw_house())
     
     def clear_fields(self):
         """Clear all input fields"""
@@ -276,8 +382,7 @@ def main():
     print("🏠 HOUSE PRICE PREDICTION SYSTEM")
     print("="*50)
     print("Starting application...")
-    print("If model doesn't exist, it will be trained automatically.")
-    print("Please wait while the system initializes...")
+    print("If model doesn't exist, it will be trained automatically in the background.")
     print("="*50)
     
     root = tk.Tk()
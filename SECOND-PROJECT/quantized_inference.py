@@ -0,0 +1,150 @@
+"""
+Quantized Inference
+Float32 and fixed-point (int16 features, int64 accumulation) paths for the linear model
+"""
+
+import time
+import numpy as np
+
+PRECISIONS = ('float64', 'float32', 'fixed')
+
+# Bound on |standardized feature| used when no calibration data is given
+DEFAULT_Z_BOUND = 8.0
+
+
+class QuantizedLinearPredictor:
+    """Reduced-precision linear predictor built from a trained scaler and model
+
+    ``float32`` standardizes and takes the dot product in single precision.
+    ``fixed`` quantizes each standardized feature to int16 with its own scale
+    (from calibration data, or +/- DEFAULT_Z_BOUND standard deviations), folds
+    those scales into int32 weights, and accumulates the dot product exactly
+    in int64 before converting back to a price. Rows with a feature outside
+    the int16 range are scored in float32 instead of being clipped.
+    """
+
+    def __init__(self, coef, intercept, mean, scale, precision='float32', calibration=None):
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}'. Choose from: {', '.join(PRECISIONS)}")
+        self.precision = precision
+        self.intercept = float(intercept)
+        self.mean32 = np.asarray(mean, dtype=np.float32)
+        self.inv_scale32 = (1 / np.asarray(scale, dtype=np.float64)).astype(np.float32)
+        self.coef32 = np.asarray(coef, dtype=np.float32)
+
+        if precision == 'fixed':
+            if calibration is not None:
+                z = (np.asarray(calibration, dtype=np.float32) - self.mean32) * self.inv_scale32
+                bound = np.maximum(np.abs(z).max(axis=0), 1e-6)
+            else:
+                bound = np.full(len(self.coef32), DEFAULT_Z_BOUND)
+            # Per-feature int16 scale, folded into the weights
+            self.z_scale = (32767 / bound).astype(np.float32)
+            folded = np.asarray(coef, dtype=np.float64) / self.z_scale
+            self.weight_scale = (2 ** 31 - 1) / np.abs(folded).max()
+            self.weights_q = np.round(folded * self.weight_scale).astype(np.int64)
+
+    @classmethod
+    def from_model(cls, model, precision='float32', calibration=None):
+        """Build from a trained linear HousePriceModel"""
+        if not hasattr(model.model, 'coef_'):
+            raise ValueError("Reduced-precision inference supports linear models only")
+        return cls(model.model.coef_, model.model.intercept_, model.scaler.mean_,
+                   model.scaler.scale_, precision, calibration)
+
+    def _standardize(self, X):
+        return (np.asarray(X, dtype=np.float32) - self.mean32) * self.inv_scale32
+
+    def quantize_features(self, X):
+        """Standardize and quantize rows to int16 (fixed mode), e.g. for compact storage
+
+        Out-of-range values saturate at +/-32767; use predict_batch for rows
+        that may fall outside the calibration range.
+        """
+        return self._quantize(self._standardize(X))[0]
+
+    def _quantize(self, z):
+        scaled = np.round(z * self.z_scale)
+        saturated = (np.abs(scaled) > 32767).any(axis=1)
+        return np.clip(scaled, -32767, 32767).astype(np.int16), saturated
+
+    def predict_quantized(self, q):
+        """Predict from int16 rows produced by quantize_features"""
+        acc = q.astype(np.int64) @ self.weights_q
+        return acc / self.weight_scale + self.intercept
+
+    def predict_batch(self, X):
+        """Predict prices for a 2-D array of rows in model feature order"""
+        z = self._standardize(X)
+        if self.precision == 'fixed':
+            q, saturated = self._quantize(z)
+            predictions = self.predict_quantized(q)
+            if saturated.any():
+                predictions[saturated] = (z[saturated] @ self.coef32) + self.intercept
+            return predictions
+        if self.precision == 'float32':
+            return (z @ self.coef32).astype(np.float64) + self.intercept
+        raise ValueError("Use the model's own float64 path for 'float64'")
+
+
+def accuracy_drift_report(model, df_model, repeats=5):
+    """Compare float32 and fixed-point predictions with float64 on the test split
+
+    Uses the same 80/20 split as train_model; fixed-point scales are calibrated
+    on the training split. Returns max/mean absolute price deviation, bytes per
+    stored feature row and throughput (from float32 input) for each precision.
+    """
+    from sklearn.model_selection import train_test_split
+
+    X = df_model[model.feature_names].to_numpy(dtype=np.float64)
+    y = df_model['Price'].to_numpy()
+    X_train, X_test, _, _ = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    reference = model.model.predict(model.scaler.transform(X_test))
+    results = {'float64': {'max_abs_dev': 0.0, 'mean_abs_dev': 0.0,
+                           'stored_bytes_per_row': X_test.shape[1] * 8,
+                           'rows_per_second': _throughput(
+                               lambda: model.model.predict(model.scaler.transform(X_test)),
+                               len(X_test), repeats)}}
+
+    X32 = X_test.astype(np.float32)
+    for precision, itemsize in (('float32', 4), ('fixed', 2)):
+        predictor = QuantizedLinearPredictor.from_model(model, precision, calibration=X_train)
+        predictions = predictor.predict_batch(X32)
+        deviation = np.abs(predictions - reference)
+        results[precision] = {
+            'max_abs_dev': float(deviation.max()),
+            'mean_abs_dev': float(deviation.mean()),
+            'stored_bytes_per_row': X_test.shape[1] * itemsize,
+            'rows_per_second': _throughput(lambda: predictor.predict_batch(X32),
+                                           len(X32), repeats)
+        }
+        if precision == 'fixed':
+            results[precision]['saturated_rows'] = int(
+                predictor._quantize(predictor._standardize(X32))[1].sum())
+
+    print(f"Inference Precision Report ({len(X_test)} test rows):")
+    for precision, r in results.items():
+        print(f"{precision:>8}: max |dev| ${r['max_abs_dev']:,.2f}, "
+              f"mean |dev| ${r['mean_abs_dev']:,.4f}, "
+              f"{r['stored_bytes_per_row']} bytes/row, {r['rows_per_second']:,.0f} rows/s")
+    print(f"   fixed: {results['fixed']['saturated_rows']} rows outside the int16 range scored in float32")
+    return results
+
+
+def _throughput(fn, rows, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return rows / best if best > 0 else float('inf')
+
+
+if __name__ == "__main__":
+    from model_training import HousePriceModel, DEFAULT_CACHE_DIR
+
+    model = HousePriceModel()
+    df_model = model.load_and_preprocess_data(cache_dir=DEFAULT_CACHE_DIR)
+    model.train_model(df_model)
+    accuracy_drift_report(model, df_model)
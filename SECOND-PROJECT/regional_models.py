@@ -0,0 +1,137 @@
+"""
+Regional Models
+Per-region sub-models trained in parallel, with vectorized routing and a global fallback
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import joblib
+import numpy as np
+
+DEFAULT_REGIONAL_DIR = 'regional_models'
+
+# Regions with fewer training rows than this are served by the global model
+DEFAULT_MIN_ROWS = 200
+
+
+def _fit_region(code, X, y, backend, path):
+    """Worker: fit a scaler and estimator on one region's rows and save them"""
+    from sklearn.preprocessing import StandardScaler
+    from model_training import ESTIMATOR_BACKENDS
+
+    start = time.perf_counter()
+    scaler = StandardScaler().fit(X)
+    model = ESTIMATOR_BACKENDS[backend]()
+    model.fit(scaler.transform(X), y)
+    joblib.dump({'scaler': scaler, 'model': model}, path)
+    return {'code': code, 'rows': len(X), 'fit_seconds': time.perf_counter() - start,
+            'file': os.path.basename(path)}
+
+
+class RegionalModelSet:
+    """Sub-models keyed by encoded Regionname, stored one file per region
+
+    Only ``index.json`` is read up front; a region's scaler and estimator are
+    loaded the first time a row routes to it. Rows whose region has no
+    sub-model (too few training rows, or unseen) are scored by ``fallback``,
+    a callable taking a 2-D feature array.
+    """
+
+    def __init__(self, directory, feature_names, regions, fallback=None):
+        self.directory = directory
+        self.feature_names = list(feature_names)
+        self.region_column = self.feature_names.index('Regionname')
+        # Encoded region -> {'rows', 'fit_seconds', 'file'}
+        self.regions = {int(code): info for code, info in regions.items()}
+        self.fallback = fallback
+        self._loaded = {}
+
+    @classmethod
+    def train(cls, X, y, feature_names, directory=DEFAULT_REGIONAL_DIR, backend='linear',
+              min_rows=DEFAULT_MIN_ROWS, max_workers=None, fallback=None):
+        """Fit one sub-model per region on a process pool
+
+        Each worker receives only its region's rows, so the data is partitioned
+        rather than copied to every process.
+        """
+        os.makedirs(directory, exist_ok=True)
+        feature_names = list(feature_names)
+        codes = np.asarray(X)[:, feature_names.index('Regionname')].astype(np.int64)
+        uniques, inverse, counts = np.unique(codes, return_inverse=True, return_counts=True)
+        order = np.argsort(inverse, kind='stable')
+        groups = np.split(order, np.cumsum(counts)[:-1])
+
+        tasks = [(int(code), rows) for code, rows in zip(uniques, groups) if len(rows) >= min_rows]
+        max_workers = max_workers or os.cpu_count()
+        print(f"Training {len(tasks)} regional models on {max_workers} processes...")
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_fit_region, code, X[rows], y[rows], backend,
+                                   os.path.join(directory, f'region_{code}.pkl'))
+                       for code, rows in tasks]
+            results = [future.result() for future in futures]
+
+        regions = {r['code']: {k: v for k, v in r.items() if k != 'code'} for r in results}
+        with open(os.path.join(directory, 'index.json'), 'w') as f:
+            json.dump({'feature_names': feature_names, 'backend': backend,
+                       'regions': regions}, f, indent=2)
+        return cls(directory, feature_names, regions, fallback)
+
+    @classmethod
+    def load(cls, directory=DEFAULT_REGIONAL_DIR, fallback=None):
+        """Read the index only; sub-models load lazily"""
+        with open(os.path.join(directory, 'index.json')) as f:
+            index = json.load(f)
+        return cls(directory, index['feature_names'], index['regions'], fallback)
+
+    def _region_model(self, code):
+        if code not in self._loaded:
+            self._loaded[code] = joblib.load(
+                os.path.join(self.directory, self.regions[code]['file']))
+        return self._loaded[code]
+
+    def predict_batch(self, X):
+        """Route rows to their region's model with one predict call per region"""
+        X = np.asarray(X, dtype=np.float64)
+        predictions = np.empty(len(X))
+        codes = X[:, self.region_column].astype(np.int64)
+        uniques, inverse = np.unique(codes, return_inverse=True)
+
+        fallback_rows = np.zeros(len(X), dtype=bool)
+        for i, code in enumerate(uniques):
+            rows = inverse == i
+            if int(code) in self.regions:
+                sub = self._region_model(int(code))
+                predictions[rows] = sub['model'].predict(sub['scaler'].transform(X[rows]))
+            else:
+                fallback_rows |= rows
+
+        if fallback_rows.any():
+            if self.fallback is None:
+                raise ValueError("No regional model for some rows and no fallback model")
+            predictions[fallback_rows] = self.fallback(X[fallback_rows])
+        return predictions
+
+
+def compare_with_global(model, df_model, regional):
+    """R² and MAE of routed vs global predictions on the train_model test split"""
+    from sklearn.model_selection import train_test_split
+    from sklearn.metrics import r2_score, mean_absolute_error
+
+    X = df_model[model.feature_names].to_numpy(dtype=np.float64)
+    y = df_model['Price'].to_numpy()
+    _, X_test, _, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    global_pred = model.model.predict(model.scaler.transform(X_test))
+    routed_pred = regional.predict_batch(X_test)
+    results = {
+        'global': {'r2': r2_score(y_test, global_pred),
+                   'mae': mean_absolute_error(y_test, global_pred)},
+        'regional': {'r2': r2_score(y_test, routed_pred),
+                     'mae': mean_absolute_error(y_test, routed_pred)}
+    }
+    print("Regional vs Global (test split):")
+    for name, r in results.items():
+        print(f"{name:>9}: R² {r['r2']:.4f}, MAE ${r['mae']:,.2f}")
+    return results
@@ -0,0 +1,89 @@
+"""
+Spatial Features
+Nearest-neighbour price features from a KD-tree over the training listings
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+# Columns appended to the model input when the spatial stage is enabled
+SPATIAL_FEATURES = ['NeighbourMedianPrice', 'NeighbourDensity']
+
+# Kilometres per degree, for projecting lat/lon onto a local flat plane
+KM_PER_DEG_LAT = 110.574
+KM_PER_DEG_LON = 111.320
+
+
+class SpatialPriceIndex:
+    """KD-tree over sold properties for k-nearest-neighbour price lookups
+
+    Coordinates are projected to kilometres around the centre of the training
+    data (accurate at city scale), so Euclidean distance approximates ground
+    distance. For each query point the index returns the median sale price of
+    the ``k`` nearest training sales and the number of sales within
+    ``radius_km``.
+    """
+
+    def __init__(self, k=10, radius_km=1.0):
+        self.k = k
+        self.radius_km = radius_km
+        self.tree = None
+        self.prices = None
+        self.origin = None
+
+    def fit(self, lat, lon, prices):
+        """Build the index from training coordinates and sale prices"""
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        self.origin = (float(np.mean(lat)), float(np.mean(lon)))
+        self.prices = np.asarray(prices, dtype=np.float64)
+        self.tree = cKDTree(self._project(lat, lon))
+        return self
+
+    def transform(self, lat, lon, own_rows=None):
+        """Spatial features for many points in one bulk query
+
+        ``own_rows`` gives, for each query point, its position in the training
+        data; that listing is left out of its own features so training rows do
+        not leak their price. It is matched by index rather than by distance,
+        since several listings can share the same coordinates.
+        """
+        points = self._project(np.asarray(lat, dtype=np.float64),
+                               np.asarray(lon, dtype=np.float64))
+        extra = 0 if own_rows is None else 1
+        k = min(self.k + extra, len(self.prices))
+        _, idx = self.tree.query(points, k=k, workers=-1)
+        idx = np.asarray(idx).reshape(len(points), k)
+        if own_rows is not None:
+            drop = idx == np.asarray(own_rows)[:, None]
+            # Own row not among the k+1 (more ties than k): drop the farthest instead
+            drop[~drop.any(axis=1), -1] = True
+            idx = idx[~drop].reshape(len(points), k - 1)
+
+        features = np.empty((len(points), len(SPATIAL_FEATURES)))
+        features[:, 0] = np.median(self.prices[idx], axis=1)
+        features[:, 1] = self.tree.query_ball_point(
+            points, self.radius_km, return_length=True, workers=-1
+        ) - extra
+        return features
+
+    def add_features(self, df, exclude_self=False):
+        """Return a copy of a feature DataFrame with the spatial columns appended
+
+        Pass ``exclude_self`` only for the frame the index was fitted on, in
+        the same row order.
+        """
+        own_rows = None
+        if exclude_self:
+            if len(df) != len(self.prices):
+                raise ValueError("exclude_self needs the rows the index was fitted on")
+            own_rows = np.arange(len(df))
+        df = df.copy()
+        df[SPATIAL_FEATURES] = self.transform(df['Lattitude'], df['Longtitude'], own_rows)
+        return df
+
+    def _project(self, lat, lon):
+        lat0, lon0 = self.origin
+        x = (lon - lon0) * KM_PER_DEG_LON * np.cos(np.radians(lat0))
+        y = (lat - lat0) * KM_PER_DEG_LAT
+        return np.column_stack([x, y])
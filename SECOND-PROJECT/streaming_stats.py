@@ -0,0 +1,93 @@
+"""
+Streaming Statistics
+Bounded-memory sketches for computing preprocessing statistics in one pass
+"""
+
+import numpy as np
+
+
+class QuantileSketch:
+    """Approximate quantiles from a fixed-size uniform sample of a stream
+
+    Every value gets a random priority and only the ``capacity`` values with
+    the smallest priorities are kept (bottom-k sampling). The result is a
+    uniform sample of everything seen so far, so quantiles are exact while
+    the stream fits in the sample and approximate afterwards. Two sketches
+    can be merged, which makes them usable across chunks or processes.
+    """
+
+    def __init__(self, capacity=200000, seed=42):
+        self.capacity = capacity
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+        self._values = np.empty(0)
+        self._priorities = np.empty(0)
+
+    def update(self, values):
+        """Add a chunk of values, ignoring missing ones"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        priorities = self._rng.random(len(values))
+        self._keep(np.concatenate([self._values, values]),
+                   np.concatenate([self._priorities, priorities]))
+
+    def merge(self, other):
+        """Combine another sketch into this one"""
+        self.count += other.count
+        self._keep(np.concatenate([self._values, other._values]),
+                   np.concatenate([self._priorities, other._priorities]))
+
+    def quantile(self, q):
+        """Return the (approximate) q-th quantile, or NaN if empty"""
+        if len(self._values) == 0:
+            return np.nan
+        return float(np.quantile(self._values, q))
+
+    def median(self):
+        """Return the (approximate) median"""
+        return self.quantile(0.5)
+
+    @property
+    def is_exact(self):
+        """True while every value seen is still held in the sample"""
+        return self.count <= self.capacity
+
+    def _keep(self, values, priorities):
+        if len(values) > self.capacity:
+            idx = np.argpartition(priorities, self.capacity)[:self.capacity]
+            values = values[idx]
+            priorities = priorities[idx]
+        self._values = values
+        self._priorities = priorities
+
+
+class CategoryCounter:
+    """Running value counts for a categorical column"""
+
+    def __init__(self):
+        self.counts = {}
+
+    def update(self, values):
+        """Add a chunk of values, ignoring missing ones"""
+        chunk_counts = values.dropna().value_counts()
+        for value, count in chunk_counts.items():
+            self.counts[value] = self.counts.get(value, 0) + int(count)
+
+    def merge(self, other):
+        """Combine another counter into this one"""
+        for value, count in other.counts.items():
+            self.counts[value] = self.counts.get(value, 0) + count
+
+    def mode(self):
+        """Most frequent value (ties resolved like pandas, by sort order)"""
+        if not self.counts:
+            return None
+        top = max(self.counts.values())
+        return sorted(v for v, c in self.counts.items() if c == top)[0]
+
+    def categories(self):
+        """Sorted list of all values seen"""
+        return sorted(self.counts)